@@ -5,19 +5,22 @@ Simple GUI launcher with error handling
 
 import sys
 import os
+from importlib.util import find_spec
 
 def check_dependencies():
-    """Check if all required modules are available"""
+    """Check if all required modules are available
+    
+    Uses find_spec so modules are located without being imported; the real
+    imports happen in main() once the check passes.
+    """
     missing = []
     
-    try:
-        import tkinter
-    except ImportError:
+    # The tkinter package ships without its compiled _tkinter extension on
+    # some distro Pythons, so look for the extension itself
+    if find_spec("_tkinter") is None:
         missing.append("tkinter (GUI framework)")
     
-    try:
-        from signal_renderer import SignalRenderer
-    except ImportError:
+    if find_spec("signal_renderer") is None:
         missing.append("signal_renderer.py (not found)")
     
     return missing
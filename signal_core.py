@@ -0,0 +1,152 @@
+"""
+Signal Core
+Tk-free form handling and report formatting behind the desktop GUI
+"""
+
+from dataclasses import replace
+from typing import Sequence
+from signal_renderer import (
+    SignalData, KeyStat, StrategyInfo, generate_chart_data,
+    SIGNAL_TYPES_BY_NAME, PRIORITIES_BY_NAME
+)
+
+# Report layouts for the Generate tab, formatted with the signal as sd
+_PREVIEW_TEMPLATE = """
+🎯 Signal Preview:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📊 Basic Info:
+   Ticker: {sd.ticker}
+   Company: {sd.company_name}
+   Signal Type: {sd.signal_type.name}
+   Priority: {sd.priority.name}
+   Timestamp: {sd.timestamp}
+
+💰 Price Data:
+   Current Price: ${sd.current_price:,.2f}
+   Price Change: ${sd.price_change:+,.2f}
+   Change %: {sd.price_change_percent:+.2f}%
+
+📈 Key Stats:
+{stats}
+🧠 Strategy:
+   Title: {sd.strategy.title}
+   Description: {description}...
+   Link: {sd.strategy.link_text}
+
+📊 Chart:
+   Pattern: {chart_pattern}
+   
+🎨 Visual:
+   YOLO Style: {yolo}
+   Border: {sd.border_style}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+_SUCCESS_TEMPLATE = """✅ SUCCESS! Signal generated successfully!
+
+📄 File: {filename}
+📁 Path: {output_path}  
+💾 Size: {file_size:,} bytes ({file_kb:.1f} KB)
+🌐 Browser: file://{abs_path}
+
+📊 Signal Details:
+   • Ticker: {sd.ticker}
+   • Type: {sd.signal_type.name}
+   • Price: ${sd.current_price:,.2f} ({sd.price_change_percent:+.1f}%)
+   • Stats: {stat_count} key metrics
+   • Strategy: {sd.strategy.title}
+
+🎨 Visual Features:
+   • Mobile-optimized responsive design
+   • Interactive charts with prediction bands
+   • Real-time price updates (every 5s)
+   • Haptic feedback for mobile devices
+   • {yolo}
+   • {border} border style
+
+🚀 Ready to view in browser!"""
+
+def build_signal(ticker: str, company_name: str, signal_type: str, priority: str,
+                 current_price: str, price_change: str, price_change_percent: str,
+                 key_stats: Sequence[KeyStat], strategy: StrategyInfo,
+                 chart_pattern: str, event_label: str, timestamp: str,
+                 is_yolo: bool, border_style: str) -> SignalData:
+    """Validate raw form values and build a SignalData with a fresh chart"""
+    # Validate required fields
+    if not ticker:
+        raise ValueError("Ticker symbol is required")
+    if not company_name:
+        raise ValueError("Company name is required")
+    
+    # Generate chart data
+    price = float(current_price)
+    chart_data = generate_chart_data(ticker, price, chart_pattern)
+    chart_data.event_label = event_label or f"Signal @ ${price:.2f}"
+    
+    return SignalData(
+        ticker=ticker,
+        company_name=company_name,
+        signal_type=SIGNAL_TYPES_BY_NAME[signal_type],
+        current_price=price,
+        price_change=float(price_change),
+        price_change_percent=float(price_change_percent),
+        priority=PRIORITIES_BY_NAME[priority],
+        key_stats=key_stats,
+        strategy=strategy,
+        chart_data=chart_data,
+        timestamp=timestamp,
+        is_yolo=is_yolo,
+        border_style=border_style
+    )
+
+def output_filename(signal: SignalData, filename: str = "") -> str:
+    """Return filename with an .html suffix, or the default name for signal"""
+    if not filename:
+        return f"{signal.ticker}_{signal.signal_type.slug}.html"
+    if not filename.endswith('.html'):
+        return filename + '.html'
+    return filename
+
+def render_key(signal: SignalData, filename: str, chart_pattern: str) -> tuple:
+    """Key identifying the inputs of a render
+    
+    The chart history is random per build, so the key covers the inputs that
+    shape the chart (pattern and event label) instead of its points.
+    """
+    return (
+        filename,
+        chart_pattern,
+        signal.chart_data.event_label,
+        repr(replace(signal, chart_data=None)),
+    )
+
+def format_preview(signal: SignalData) -> str:
+    """Render the Preview Data report"""
+    stats = "".join(
+        f"   {i}. {stat.value} - {stat.label} {'(+)' if stat.is_positive else '(-)'}\n"
+        for i, stat in enumerate(signal.key_stats, 1)
+    )
+    chart = signal.chart_data
+    return _PREVIEW_TEMPLATE.format(
+        sd=signal,
+        stats=stats,
+        description=signal.strategy.description[:100],
+        chart_pattern=chart.event_label if chart else 'Auto-generated',
+        yolo='Yes' if signal.is_yolo else 'No',
+    )
+
+def format_success(signal: SignalData, filename: str, output_path: str,
+                   file_size: int, abs_path: str) -> str:
+    """Render the report for a successfully written signal file"""
+    return _SUCCESS_TEMPLATE.format(
+        sd=signal,
+        filename=filename,
+        output_path=output_path,
+        file_size=file_size,
+        file_kb=file_size / 1024,
+        abs_path=abs_path,
+        stat_count=len(signal.key_stats),
+        yolo='YOLO glow effects' if signal.is_yolo else 'Standard styling',
+        border=signal.border_style.title(),
+    )
@@ -0,0 +1,317 @@
+"""
+Signal Fixtures
+Shared sample signal definitions used by the example and suite generators
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, Tuple
+from signal_renderer import (
+    SignalData, SignalType, SignalPriority, KeyStat, StrategyInfo,
+    generate_chart_data
+)
+
+@dataclass(frozen=True, slots=True)
+class SignalSpec:
+    """Static signal definition; chart data is synthesized at render time"""
+    ticker: str
+    company_name: str
+    signal_type: SignalType
+    priority: SignalPriority
+    current_price: float
+    price_change: float
+    price_change_percent: float
+    key_stats: Tuple[KeyStat, ...]
+    strategy: StrategyInfo
+    timestamp: str
+    pattern: str
+    is_yolo: bool = False
+    border_style: str = "solid"
+    
+    def to_signal(self, **overrides) -> SignalData:
+        """Build a SignalData with freshly generated chart data
+        
+        Key stats and strategy are copied, so edits to one signal never leak
+        into the shared fixture or later signals built from it.
+        """
+        return SignalData(
+            ticker=self.ticker,
+            company_name=self.company_name,
+            signal_type=self.signal_type,
+            current_price=self.current_price,
+            price_change=self.price_change,
+            price_change_percent=self.price_change_percent,
+            priority=self.priority,
+            key_stats=[replace(stat) for stat in self.key_stats],
+            strategy=replace(self.strategy) if self.strategy else None,
+            chart_data=generate_chart_data(self.ticker, self.current_price, self.pattern),
+            timestamp=self.timestamp,
+            is_yolo=self.is_yolo,
+            border_style=self.border_style,
+            **overrides
+        )
+
+# One fixture per signal type, in display order
+SIGNAL_FIXTURES = (
+    # IPO Signal - Hot debut
+    SignalSpec(
+        ticker="CRCL",
+        company_name="Circle Internet Group",
+        signal_type=SignalType.IPO_TODAY,
+        priority=SignalPriority.HOT,
+        current_price=69.00,
+        price_change=38.00,
+        price_change_percent=122.6,
+        key_stats=(
+            KeyStat("223%", "Day 1 High", True),
+            KeyStat("$6.8B", "Valuation"),
+            KeyStat("46M", "Volume")
+        ),
+        strategy=StrategyInfo(
+            title="Hot IPO Momentum Play",
+            description="Stablecoin leader 3x'd on debut. ARK bought $150M. Watch for dip to $60-65 for entry. Similar to Coinbase IPO pattern - expect volatility.",
+            link_text="IPO playbook →",
+            link_url="https://example.com/ipo-trading-strategy"
+        ),
+        timestamp="15 min ago",
+        pattern="breakout",
+        is_yolo=False,
+        border_style="solid"
+    ),
+    
+    # YOLO Signal - High risk Bitcoin play
+    SignalSpec(
+        ticker="BTC",
+        company_name="Bitcoin 150K Moonshot",
+        signal_type=SignalType.YOLO_CALLS,
+        priority=SignalPriority.NORMAL,
+        current_price=105456.00,
+        price_change=3850.00,
+        price_change_percent=3.8,
+        key_stats=(
+            KeyStat("250%", "Max Gain", True),
+            KeyStat("-100%", "Max Loss", False),
+            KeyStat("$850", "Per Call")
+        ),
+        strategy=StrategyInfo(
+            title="Dec 150K Call Options",
+            description="Kalshi shows 75% odds of 150K by Q4. Buy $130K calls for December. High risk, high reward - only risk what you can lose!",
+            link_text="View odds →",
+            link_url="https://kalshi.com/markets/kxbtcmax150"
+        ),
+        timestamp="1 hour ago",
+        pattern="momentum",
+        is_yolo=True,
+        border_style="solid"
+    ),
+    
+    # Pre-Market Signal - Gap up play
+    SignalSpec(
+        ticker="NVDA",
+        company_name="Nvidia Pre-Market Surge",
+        signal_type=SignalType.PRE_MARKET,
+        priority=SignalPriority.NORMAL,
+        current_price=1125.50,
+        price_change=55.50,
+        price_change_percent=5.2,
+        key_stats=(
+            KeyStat("+6.8%", "Pre-Mkt", True),
+            KeyStat("2.5M", "Volume"),
+            KeyStat("9:28", "Entry")
+        ),
+        strategy=StrategyInfo(
+            title="Pre-Market Gap & Go",
+            description="TSMC production boost news. Pre-market up 6.8% on heavy volume. Buy at 9:28-9:30 for opening momentum. Set stop at pre-market low.",
+            link_text="Pre-market guide →",
+            link_url="https://example.com/premarket-trading"
+        ),
+        timestamp="Pre-market",
+        pattern="breakout",
+        is_yolo=False,
+        border_style="dashed"
+    ),
+    
+    # Stock Split Signal
+    SignalSpec(
+        ticker="AMZN",
+        company_name="Amazon Split Announced",
+        signal_type=SignalType.STOCK_SPLIT,
+        priority=SignalPriority.NORMAL,
+        current_price=3245.00,
+        price_change=245.00,
+        price_change_percent=8.2,
+        key_stats=(
+            KeyStat("20:1", "Ratio"),
+            KeyStat("+15%", "Avg Run", True),
+            KeyStat("28d", "To Split")
+        ),
+        strategy=StrategyInfo(
+            title="Pre-Split Momentum",
+            description="20:1 split announced. Historical data shows 15% avg gain from announcement to split date. Buy shares or Aug calls. Retail FOMO incoming.",
+            link_text="Split history →",
+            link_url="https://example.com/stock-split-strategy"
+        ),
+        timestamp="2 hours ago",
+        pattern="momentum",
+        is_yolo=False,
+        border_style="solid"
+    ),
+    
+    # Options Spread Signal
+    SignalSpec(
+        ticker="TSLA",
+        company_name="Tesla Iron Condor",
+        signal_type=SignalType.PUT_SPREAD,
+        priority=SignalPriority.NORMAL,
+        current_price=245.80,
+        price_change=-2.85,
+        price_change_percent=-1.2,
+        key_stats=(
+            KeyStat("$3.20", "Credit"),
+            KeyStat("72%", "PoP", True),
+            KeyStat("21d", "DTE")
+        ),
+        strategy=StrategyInfo(
+            title="Sell 240/235 Put Spread",
+            description="Post-earnings IV crush. Sell 240/235 put spread for $3.20 credit. 72% probability of profit. Max loss $180. Range-bound expected.",
+            link_text="Spread calculator →",
+            link_url="https://example.com/credit-spreads"
+        ),
+        timestamp="3 hours ago",
+        pattern="volatile",
+        is_yolo=False,
+        border_style="solid"
+    ),
+    
+    # Crypto DeFi Signal
+    SignalSpec(
+        ticker="ETH",
+        company_name="Ethereum Staking Play",
+        signal_type=SignalType.CRYPTO_DEFI,
+        priority=SignalPriority.NORMAL,
+        current_price=3856.00,
+        price_change=166.00,
+        price_change_percent=4.5,
+        key_stats=(
+            KeyStat("5.2%", "APY", True),
+            KeyStat("$4.2K", "Target"),
+            KeyStat("85", "RSI")
+        ),
+        strategy=StrategyInfo(
+            title="Stake & Trade Momentum",
+            description="Shanghai upgrade complete. Staking APY 5.2% + price appreciation. Buy spot ETH or ETHE. DeFi TVL surging, institutions accumulating.",
+            link_text="Staking guide →",
+            link_url="https://example.com/eth-staking"
+        ),
+        timestamp="4 hours ago",
+        pattern="momentum",
+        is_yolo=False,
+        border_style="solid"
+    ),
+    
+    # FDA Event Signal
+    SignalSpec(
+        ticker="SAVA",
+        company_name="Cassava Sciences",
+        signal_type=SignalType.FDA_EVENT,
+        priority=SignalPriority.NORMAL,
+        current_price=42.15,
+        price_change=4.65,
+        price_change_percent=12.3,
+        key_stats=(
+            KeyStat("+180%", "If Pass", True),
+            KeyStat("-65%", "If Fail", False),
+            KeyStat("220%", "IV")
+        ),
+        strategy=StrategyInfo(
+            title="Binary FDA Event - YOLO!",
+            description="Alzheimer's drug PDUFA date 7/28. Buy OTM calls for 10x potential. Ultra high risk - total loss possible. Size accordingly!",
+            link_text="FDA calendar →",
+            link_url="https://example.com/fda-calendar"
+        ),
+        timestamp="5 hours ago",
+        pattern="volatile",
+        is_yolo=True,
+        border_style="solid"
+    ),
+    
+    # Earnings Signal
+    SignalSpec(
+        ticker="GOOGL",
+        company_name="Google Post-Earnings",
+        signal_type=SignalType.EARNINGS,
+        priority=SignalPriority.NORMAL,
+        current_price=178.25,
+        price_change=13.96,
+        price_change_percent=8.5,
+        key_stats=(
+            KeyStat("+11%", "AH Move", True),
+            KeyStat("$185", "Target"),
+            KeyStat("5.2M", "AH Vol")
+        ),
+        strategy=StrategyInfo(
+            title="Post-Earnings Momentum",
+            description="Crushed earnings, raised guidance. After-hours up 11%. Buy at open for continuation. Historical 3-day momentum after beats averages +5%.",
+            link_text="ER playbook →",
+            link_url="https://example.com/earnings-momentum"
+        ),
+        timestamp="After hours",
+        pattern="momentum",
+        is_yolo=False,
+        border_style="solid"
+    ),
+    
+    # Unusual Options Activity
+    SignalSpec(
+        ticker="AMD",
+        company_name="Unusual Call Buying",
+        signal_type=SignalType.UNUSUAL_OPTIONS,
+        priority=SignalPriority.WATCH,
+        current_price=185.40,
+        price_change=3.85,
+        price_change_percent=2.1,
+        key_stats=(
+            KeyStat("$2.5M", "Premium"),
+            KeyStat("10x", "Avg Vol"),
+            KeyStat("$200", "Strike")
+        ),
+        strategy=StrategyInfo(
+            title="Follow the Smart Money",
+            description="10,000 Aug $200 calls bought for $2.5M. 10x normal volume. Someone knows something. Follow with smaller position or spreads.",
+            link_text="Flow data →",
+            link_url="https://example.com/options-flow"
+        ),
+        timestamp="30 min ago",
+        pattern="momentum",
+        is_yolo=False,
+        border_style="solid"
+    ),
+    
+    # Meme Squeeze Signal
+    SignalSpec(
+        ticker="GME",
+        company_name="GameStop Gamma Ramp",
+        signal_type=SignalType.MEME_SQUEEZE,
+        priority=SignalPriority.NORMAL,
+        current_price=45.20,
+        price_change=11.78,
+        price_change_percent=35.2,
+        key_stats=(
+            KeyStat("140%", "Short %"),
+            KeyStat("+420%", "Target", True),
+            KeyStat("💎🙌", "Hands")
+        ),
+        strategy=StrategyInfo(
+            title="Diamond Hands Squeeze Play",
+            description="Short interest 140%, cost to borrow 85%. Gamma ramp building. Pure YOLO - lottery ticket only! Not investment advice. Apes together strong! 🚀",
+            link_text="Join apes →",
+            link_url="https://reddit.com/r/wallstreetbets"
+        ),
+        timestamp="TO THE MOON!",
+        pattern="volatile",
+        is_yolo=True,
+        border_style="solid"
+    )
+)
+
+# Fixture lookup by ticker symbol
+FIXTURES_BY_TICKER: Dict[str, SignalSpec] = {spec.ticker: spec for spec in SIGNAL_FIXTURES}
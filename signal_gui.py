@@ -5,44 +5,288 @@ Signal Generator GUI - Interactive tool for creating trading signal HTML pages
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
+import atexit
 import os
+import queue
+import subprocess
+import sys
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from signal_renderer import (
-    SignalRenderer, SignalData, SignalType, SignalPriority, 
-    ChartData, KeyStat, StrategyInfo, generate_chart_data
+    SignalRenderer, SignalType, SignalPriority, KeyStat, StrategyInfo
 )
+from signal_core import build_signal, output_filename, render_key, format_preview, format_success
+
+_OUTPUT_DIR = os.path.abspath("gui_generated")
+
+# Shared worker threads for rendering signals off the Tk thread
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="signalgui")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+# How often the Tk thread checks for finished renders while any are running
+_RENDER_POLL_MS = 50
+
+# Dark theme palette
+_BG_DARK = '#1a1a1a'
+_BG = '#2a2a2a'
+_BG_RAISED = '#3a3a3a'
+_ACCENT = '#00ff88'
+_DIM = '#aaa'
+_MUTED = '#888'
+
+# ttk style settings for the dark theme
+_TTK_STYLES = {
+    'TLabel': {'foreground': 'white', 'background': _BG_DARK},
+    'TFrame': {'background': _BG_DARK},
+    'TNotebook': {'background': _BG},
+    'TNotebook.Tab': {'background': _BG, 'foreground': 'white'},
+}
+_TTK_STYLE_MAPS = {
+    'TNotebook.Tab': {'background': [('selected', _ACCENT)]},
+}
+
+# Tk option database defaults for the classic widgets; widgets only pass
+# colors and fonts explicitly where they differ from these
+_TK_OPTION_DEFAULTS = (
+    ('*Frame.background', _BG),
+    ('*Canvas.background', _BG),
+    ('*Label.background', _BG),
+    ('*Label.foreground', 'white'),
+    ('*Entry.background', _BG_RAISED),
+    ('*Entry.foreground', 'white'),
+    ('*Checkbutton.background', _BG),
+    ('*Checkbutton.foreground', 'white'),
+    ('*Checkbutton.selectColor', _BG_RAISED),
+    ('*Labelframe.background', _BG_RAISED),
+    ('*Labelframe.foreground', 'white'),
+    ('*Labelframe.font', 'Arial 11 bold'),
+    # Key stat groups (LabelFrames of class Stat) invert the frame/field shades
+    ('*Stat.background', _BG_RAISED),
+    ('*Stat.foreground', 'white'),
+    ('*Stat.font', 'Arial 11 bold'),
+    ('*Stat.Label.background', _BG_RAISED),
+    ('*Stat.Label.font', 'Arial 10 bold'),
+    ('*Stat.Entry.background', _BG),
+    ('*Stat.Checkbutton.background', _BG_RAISED),
+    ('*Stat.Checkbutton.selectColor', _BG),
+)
+
+# Default (value, label) for each key stat row
+_STAT_DEFAULTS = (("$185", "Target"), ("", ""), ("", ""))
+
+# Combobox choices, fixed for the lifetime of the process
+_SIGNAL_TYPE_NAMES = tuple(st.name for st in SignalType)
+_PRIORITY_NAMES = tuple(p.name for p in SignalPriority)
+_BORDER_STYLES = ("solid", "dashed")
+_PATTERNS = ("momentum", "volatile", "breakout", "decline")
+
+# Signal type descriptions shown on the Basic Info tab
+_SIGNAL_TYPE_DESCRIPTIONS = {
+    "IPO_TODAY": "New IPO debuts and momentum plays",
+    "YOLO_CALLS": "High-risk, high-reward options plays",
+    "PRE_MARKET": "Pre-market movers and gap plays",
+    "STOCK_SPLIT": "Stock split announcements",
+    "PUT_SPREAD": "Options credit spreads",
+    "CRYPTO_DEFI": "Crypto and DeFi plays",
+    "FDA_EVENT": "Biotech FDA catalysts",
+    "EARNINGS": "Earnings momentum plays",
+    "UNUSUAL_OPTIONS": "Unusual options flow",
+    "MEME_SQUEEZE": "Meme stock squeeze plays"
+}
+_SIGNAL_TYPE_DESC_TEXT = "Signal Type Descriptions:\n\n" + "".join(
+    f"• {signal_type}: {desc}\n" for signal_type, desc in _SIGNAL_TYPE_DESCRIPTIONS.items()
+)
+
+# Example key stats per signal type
+_KEY_STATS_EXAMPLES = """
+IPO: ["223%", "Day 1 High"] | ["$6.8B", "Valuation"] | ["46M", "Volume"]
+Options: ["$3.20", "Credit"] | ["72%", "PoP"] | ["21d", "DTE"]  
+Crypto: ["5.2%", "APY"] | ["$4.2K", "Target"] | ["85", "RSI"]
+FDA: ["+180%", "If Pass"] | ["-65%", "If Fail"] | ["220%", "IV"]
+"""
+
+# Example strategy descriptions per signal type
+_STRATEGY_EXAMPLES = """
+IPO: "Stablecoin leader 3x'd on debut. ARK bought $150M. Watch for dip to $60-65 for entry."
+YOLO: "Kalshi shows 75% odds of 150K by Q4. High risk, high reward - only risk what you can lose!"
+Pre-Market: "TSMC production boost news. Pre-market up 6.8% on heavy volume. Buy at 9:28-9:30."
+Options: "Post-earnings IV crush. Sell put spread for credit. 72% probability of profit."
+Crypto: "Shanghai upgrade complete. Staking APY 5.2% + price appreciation. DeFi TVL surging."
+FDA: "Alzheimer's drug PDUFA date 7/28. Binary event - ultra high risk, total loss possible."
+"""
+
+# Chart pattern descriptions
+_CHART_PATTERN_DESCRIPTIONS = """
+momentum: Strong upward trend
+volatile: High volatility swings  
+breakout: Consolidation then breakout
+decline: Downward trend
+"""
+
+# Example chart event labels
+_EVENT_LABEL_EXAMPLES = """
+Examples:
+• IPO: "IPO $31 → $103 peak"
+• YOLO: "Kalshi 75% → 150K" 
+• Pre-market: "Taiwan news 4AM"
+• FDA: "FDA 7/28"
+• Options: "IV Crush Play"
+"""
+
+# Chart generation notes
+_CHART_INFO_TEXT = """
+Charts are automatically generated with:
+• Historical data (20 points) - solid line showing past price action
+• Prediction bands - dashed lines showing bull/bear scenarios  
+• Event marker - shows catalyst or signal trigger point
+• Mobile optimization - 100px height for mobile screens
+"""
+
+# Welcome instructions shown when the GUI starts
+_WELCOME_TEXT = """
+Welcome to SignalPro Signal Generator!
+
+📋 Getting Started:
+1. Fill out each tab with your signal data
+2. Use the Preview button to check your data
+3. Click Generate to create the HTML file
+4. Open the file in your browser to view
+
+💡 Tips:
+• Fields marked with * are required
+• Key Stats should have exactly 3 items for mobile layout
+• YOLO signals get special glowing effects
+• Pre-market signals typically use dashed borders
+• All generated files are mobile-optimized
+
+🎯 Ready to create professional trading signals!
+"""
+
+def _launch(args):
+    """Start a helper program detached from the GUI without waiting for it"""
+    subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, close_fds=True, start_new_session=True)
+
+# Platform file manager launcher, resolved once
+if sys.platform == "win32":
+    _open_folder = os.startfile
+elif sys.platform == "darwin":
+    _open_folder = lambda path: _launch(["open", path])
+else:
+    _open_folder = lambda path: _launch(["xdg-open", path])
+
+def _grid_row(row, *widgets, **options):
+    """Grid widgets into consecutive columns of row with a single Tcl grid call"""
+    args = []
+    for name, value in options.items():
+        args += ('-' + name, value)
+    widgets[0].tk.call('grid', 'configure', *widgets, '-row', row, *args)
+
+
+class Notifier:
+    """Non-modal notification banners stacked above the notebook
+    
+    Banners dismiss themselves after timeout_ms or when clicked. Repeating a
+    message that is still showing bumps a counter on its banner instead of
+    stacking a duplicate.
+    """
+    
+    _COLORS = {'info': '#3498db', 'error': '#ff4757'}
+    
+    def __init__(self, root, timeout_ms=5000):
+        self.root = root
+        self.timeout_ms = timeout_ms
+        self.frame = tk.Frame(root, bg=_BG_DARK)
+        # (level, message) -> [label, count, after id]
+        self._banners = {}
+    
+    def info(self, message):
+        self._show('info', message)
+    
+    def error(self, message):
+        self._show('error', message)
+    
+    def _show(self, level, message):
+        key = (level, message)
+        banner = self._banners.get(key)
+        if banner is None:
+            label = tk.Label(self.frame, bg=self._COLORS[level], fg='white', font=('Arial', 10),
+                             anchor='w', justify='left', wraplength=740, padx=10, pady=4)
+            label.pack(fill='x', pady=(0, 2))
+            label.bind('<Button-1>', lambda e: self.dismiss(key))
+            banner = self._banners[key] = [label, 0, None]
+        else:
+            self.root.after_cancel(banner[2])
+        
+        banner[1] += 1
+        banner[0].configure(text=message if banner[1] == 1 else f"{message} (x{banner[1]})")
+        banner[2] = self.root.after(self.timeout_ms, self.dismiss, key)
+    
+    def dismiss(self, key):
+        banner = self._banners.pop(key, None)
+        if banner is not None:
+            self.root.after_cancel(banner[2])
+            banner[0].destroy()
 
 class SignalGeneratorGUI:
+    # Root whose Tcl interpreter already has the dark theme styles
+    _styled_root = None
+    
     def __init__(self, root):
         self.root = root
         self.root.title("SignalPro - Trading Signal Generator")
         self.root.geometry("800x900")
-        self.root.configure(bg='#1a1a1a')
+        self.root.configure(bg=_BG_DARK)
         
-        # Configure style
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Configure colors for dark theme
-        style.configure('TLabel', foreground='white', background='#1a1a1a')
-        style.configure('TFrame', background='#1a1a1a')
-        style.configure('TNotebook', background='#2a2a2a')
-        style.configure('TNotebook.Tab', background='#2a2a2a', foreground='white')
-        style.map('TNotebook.Tab', background=[('selected', '#00ff88')])
+        # Configure style (once per Tk root - styles and the option
+        # database live in its interpreter)
+        if SignalGeneratorGUI._styled_root is not root:
+            self.apply_styles(root)
+            SignalGeneratorGUI._styled_root = root
         
         self.renderer = SignalRenderer(output_dir="gui_generated")
+        self._scroll_after_id = None
+        # (inputs key, output path) of the last rendered signal
+        self._last_render = (None, None)
+        # Finished renders handed from worker threads to the Tk thread, which
+        # polls for them while any are outstanding
+        self._render_results = queue.Queue()
+        self._pending_renders = 0
+        
+        # Keep the window unmapped while the widget tree is built so it is
+        # laid out and drawn once; a root that arrived withdrawn (tests,
+        # embedding) stays withdrawn
+        was_visible = self.root.state() != 'withdrawn'
+        self.root.withdraw()
         self.create_widgets()
+        self.root.update_idletasks()
+        if was_visible:
+            self.root.deiconify()
+        
+    @staticmethod
+    def apply_styles(root):
+        """Apply the dark theme ttk styles and widget defaults to root's interpreter"""
+        for pattern, value in _TK_OPTION_DEFAULTS:
+            root.option_add(pattern, value)
+        
+        style = ttk.Style(root)
+        style.theme_use('clam')
+        for name, options in _TTK_STYLES.items():
+            style.configure(name, **options)
+        for name, options in _TTK_STYLE_MAPS.items():
+            style.map(name, **options)
         
     def create_widgets(self):
         # Main title
-        title_frame = tk.Frame(self.root, bg='#1a1a1a')
+        title_frame = tk.Frame(self.root, bg=_BG_DARK)
         title_frame.pack(pady=10)
         
         title_label = tk.Label(
             title_frame,
             text="🎯 SignalPro Signal Generator",
             font=('Arial', 18, 'bold'),
-            bg='#1a1a1a',
-            fg='#00ff88'
+            bg=_BG_DARK,
+            fg=_ACCENT
         )
         title_label.pack()
         
@@ -50,35 +294,72 @@ class SignalGeneratorGUI:
             title_frame,
             text="Create mobile-optimized trading signal HTML pages",
             font=('Arial', 10),
-            bg='#1a1a1a',
-            fg='#aaa'
+            bg=_BG_DARK,
+            fg=_DIM
         )
         subtitle_label.pack()
         
+        # Notification banners between the title and the tabs
+        self.notifier = Notifier(self.root)
+        self.notifier.frame.pack(fill='x', padx=10)
+        
         # Create notebook for sections
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(expand=True, fill='both', padx=10, pady=5)
         
-        # Create tabs
-        self.create_basic_info_tab()
-        self.create_price_data_tab()
-        self.create_key_stats_tab()
-        self.create_strategy_tab()
-        self.create_chart_tab()
-        self.create_generate_tab()
+        # Create empty tabs; each is filled in the first time it is selected
+        self._tab_builders = {}
+        tabs = (
+            ("Basic Info", self.create_basic_info_tab),
+            ("Price Data", self.create_price_data_tab),
+            ("Key Stats", self.create_key_stats_tab),
+            ("Strategy", self.create_strategy_tab),
+            ("Chart Data", self.create_chart_tab),
+            ("Generate", self.create_generate_tab),
+        )
+        for index, (text, builder) in enumerate(tabs):
+            frame = tk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[index] = (builder, frame)
+        
+        self.build_tab(0)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
+    def build_tab(self, index):
+        """Build a tab's widgets if they have not been built yet"""
+        pending = self._tab_builders.pop(index, None)
+        if pending:
+            builder, frame = pending
+            builder(frame)
+            
+    def build_all_tabs(self):
+        """Build every remaining tab so all form variables exist"""
+        for index in sorted(self._tab_builders):
+            self.build_tab(index)
+            
+    def _on_tab_changed(self, event):
+        self.build_tab(self.notebook.index('current'))
+        
+    def _schedule_scrollregion(self, canvas):
+        """Refresh canvas's scrollregion at most once per 16 ms frame while resizing"""
+        if self._scroll_after_id is not None:
+            return
+        
+        def update_scrollregion():
+            self._scroll_after_id = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
         
-    def create_basic_info_tab(self):
-        frame = tk.Frame(self.notebook, bg='#2a2a2a')
-        self.notebook.add(frame, text="Basic Info")
+        self._scroll_after_id = self.root.after(16, update_scrollregion)
         
+    def create_basic_info_tab(self, frame):
         # Create scrollable frame
-        canvas = tk.Canvas(frame, bg='#2a2a2a')
+        canvas = tk.Canvas(frame)
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#2a2a2a')
+        scrollable_frame = tk.Frame(canvas)
         
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: self._schedule_scrollregion(canvas)
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -91,162 +372,126 @@ class SignalGeneratorGUI:
         row = 0
         
         # Ticker
-        tk.Label(scrollable_frame, text="Ticker Symbol *", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', padx=10, pady=5)
+        tk.Label(scrollable_frame, text="Ticker Symbol *", font=('Arial', 11, 'bold')).grid(row=row, column=0, sticky='w', padx=10, pady=5)
         self.ticker_var = tk.StringVar(value="AAPL")
-        tk.Entry(scrollable_frame, textvariable=self.ticker_var, width=20, 
-                font=('Arial', 11), bg='#3a3a3a', fg='white').grid(row=row, column=1, sticky='w', padx=10, pady=5)
-        tk.Label(scrollable_frame, text="e.g., AAPL, BTC, TSLA", font=('Arial', 9), 
-                bg='#2a2a2a', fg='#888').grid(row=row, column=2, sticky='w', padx=5, pady=5)
+        tk.Entry(scrollable_frame, textvariable=self.ticker_var, width=20,
+                font=('Arial', 11)).grid(row=row, column=1, sticky='w', padx=10, pady=5)
+        tk.Label(scrollable_frame, text="e.g., AAPL, BTC, TSLA", font=('Arial', 9), fg=_MUTED).grid(row=row, column=2, sticky='w', padx=5, pady=5)
         
         row += 1
         
         # Company Name
-        tk.Label(scrollable_frame, text="Company Name *", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', padx=10, pady=5)
+        tk.Label(scrollable_frame, text="Company Name *", font=('Arial', 11, 'bold')).grid(row=row, column=0, sticky='w', padx=10, pady=5)
         self.company_var = tk.StringVar(value="Apple Inc")
-        tk.Entry(scrollable_frame, textvariable=self.company_var, width=40, 
-                font=('Arial', 11), bg='#3a3a3a', fg='white').grid(row=row, column=1, columnspan=2, sticky='w', padx=10, pady=5)
+        tk.Entry(scrollable_frame, textvariable=self.company_var, width=40,
+                font=('Arial', 11)).grid(row=row, column=1, columnspan=2, sticky='w', padx=10, pady=5)
         
         row += 1
         
         # Signal Type
-        tk.Label(scrollable_frame, text="Signal Type *", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', padx=10, pady=5)
+        tk.Label(scrollable_frame, text="Signal Type *", font=('Arial', 11, 'bold')).grid(row=row, column=0, sticky='w', padx=10, pady=5)
         self.signal_type_var = tk.StringVar(value="EARNINGS")
         signal_combo = ttk.Combobox(scrollable_frame, textvariable=self.signal_type_var, width=25,
-                                   values=[st.name for st in SignalType])
+                                   values=_SIGNAL_TYPE_NAMES)
         signal_combo.grid(row=row, column=1, sticky='w', padx=10, pady=5)
         
         row += 1
         
         # Signal Type descriptions
-        descriptions = {
-            "IPO_TODAY": "New IPO debuts and momentum plays",
-            "YOLO_CALLS": "High-risk, high-reward options plays",
-            "PRE_MARKET": "Pre-market movers and gap plays",
-            "STOCK_SPLIT": "Stock split announcements",
-            "PUT_SPREAD": "Options credit spreads",
-            "CRYPTO_DEFI": "Crypto and DeFi plays",
-            "FDA_EVENT": "Biotech FDA catalysts",
-            "EARNINGS": "Earnings momentum plays",
-            "UNUSUAL_OPTIONS": "Unusual options flow",
-            "MEME_SQUEEZE": "Meme stock squeeze plays"
-        }
-        
         desc_text = scrolledtext.ScrolledText(scrollable_frame, width=70, height=8, 
-                                            bg='#3a3a3a', fg='#aaa', font=('Arial', 9))
+                                            bg=_BG_RAISED, fg=_DIM, font=('Arial', 9))
         desc_text.grid(row=row, column=0, columnspan=3, padx=10, pady=5)
         
-        desc_content = "Signal Type Descriptions:\n\n"
-        for signal_type, desc in descriptions.items():
-            desc_content += f"• {signal_type}: {desc}\n"
-        
-        desc_text.insert('1.0', desc_content)
+        desc_text.insert('1.0', _SIGNAL_TYPE_DESC_TEXT)
         desc_text.config(state='disabled')
         
         row += 1
         
         # Priority
-        tk.Label(scrollable_frame, text="Priority Level", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', padx=10, pady=5)
+        tk.Label(scrollable_frame, text="Priority Level", font=('Arial', 11, 'bold')).grid(row=row, column=0, sticky='w', padx=10, pady=5)
         self.priority_var = tk.StringVar(value="NORMAL")
         priority_combo = ttk.Combobox(scrollable_frame, textvariable=self.priority_var, width=15,
-                                     values=[p.name for p in SignalPriority])
+                                     values=_PRIORITY_NAMES)
         priority_combo.grid(row=row, column=1, sticky='w', padx=10, pady=5)
-        tk.Label(scrollable_frame, text="HOT = 🔥, URGENT = ⚡, WATCH = 👀", font=('Arial', 9), 
-                bg='#2a2a2a', fg='#888').grid(row=row, column=2, sticky='w', padx=5, pady=5)
+        tk.Label(scrollable_frame, text="HOT = 🔥, URGENT = ⚡, WATCH = 👀", font=('Arial', 9), fg=_MUTED).grid(row=row, column=2, sticky='w', padx=5, pady=5)
         
         row += 1
         
         # Timestamp
-        tk.Label(scrollable_frame, text="Timestamp", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', padx=10, pady=5)
+        tk.Label(scrollable_frame, text="Timestamp", font=('Arial', 11, 'bold')).grid(row=row, column=0, sticky='w', padx=10, pady=5)
         self.timestamp_var = tk.StringVar(value="Just now")
-        tk.Entry(scrollable_frame, textvariable=self.timestamp_var, width=20, 
-                font=('Arial', 11), bg='#3a3a3a', fg='white').grid(row=row, column=1, sticky='w', padx=10, pady=5)
-        tk.Label(scrollable_frame, text="e.g., '15 min ago', 'Pre-market', 'After hours'", font=('Arial', 9), 
-                bg='#2a2a2a', fg='#888').grid(row=row, column=2, sticky='w', padx=5, pady=5)
-        
-    def create_price_data_tab(self):
-        frame = tk.Frame(self.notebook, bg='#2a2a2a')
-        self.notebook.add(frame, text="Price Data")
+        tk.Entry(scrollable_frame, textvariable=self.timestamp_var, width=20,
+                font=('Arial', 11)).grid(row=row, column=1, sticky='w', padx=10, pady=5)
+        tk.Label(scrollable_frame, text="e.g., '15 min ago', 'Pre-market', 'After hours'", font=('Arial', 9), fg=_MUTED).grid(row=row, column=2, sticky='w', padx=5, pady=5)
         
+    def create_price_data_tab(self, frame):
         # Create main container
-        container = tk.Frame(frame, bg='#2a2a2a')
+        container = tk.Frame(frame)
         container.pack(expand=True, fill='both', padx=20, pady=20)
         
         row = 0
         
         # Current Price
-        tk.Label(container, text="Current Price ($) *", font=('Arial', 12, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', pady=10)
-        self.price_var = tk.DoubleVar(value=175.50)
-        price_entry = tk.Entry(container, textvariable=self.price_var, width=15, 
-                              font=('Arial', 12), bg='#3a3a3a', fg='white')
+        tk.Label(container, text="Current Price ($) *", font=('Arial', 12, 'bold')).grid(row=row, column=0, sticky='w', pady=10)
+        self.price_var = tk.StringVar(value="175.5")
+        price_entry = tk.Entry(container, textvariable=self.price_var, width=15,
+                              font=('Arial', 12))
         price_entry.grid(row=row, column=1, sticky='w', padx=10, pady=10)
         
         row += 1
         
         # Price Change ($)
-        tk.Label(container, text="Price Change ($)", font=('Arial', 12, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', pady=10)
-        self.price_change_var = tk.DoubleVar(value=5.25)
-        tk.Entry(container, textvariable=self.price_change_var, width=15, 
-                font=('Arial', 12), bg='#3a3a3a', fg='white').grid(row=row, column=1, sticky='w', padx=10, pady=10)
-        tk.Label(container, text="Positive for gains, negative for losses", font=('Arial', 9), 
-                bg='#2a2a2a', fg='#888').grid(row=row, column=2, sticky='w', padx=5, pady=10)
+        tk.Label(container, text="Price Change ($)", font=('Arial', 12, 'bold')).grid(row=row, column=0, sticky='w', pady=10)
+        self.price_change_var = tk.StringVar(value="5.25")
+        tk.Entry(container, textvariable=self.price_change_var, width=15,
+                font=('Arial', 12)).grid(row=row, column=1, sticky='w', padx=10, pady=10)
+        tk.Label(container, text="Positive for gains, negative for losses", font=('Arial', 9), fg=_MUTED).grid(row=row, column=2, sticky='w', padx=5, pady=10)
         
         row += 1
         
         # Price Change Percentage
-        tk.Label(container, text="Price Change (%) *", font=('Arial', 12, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', pady=10)
-        self.price_change_pct_var = tk.DoubleVar(value=3.2)
-        tk.Entry(container, textvariable=self.price_change_pct_var, width=15, 
-                font=('Arial', 12), bg='#3a3a3a', fg='white').grid(row=row, column=1, sticky='w', padx=10, pady=10)
-        tk.Label(container, text="e.g., 3.2 for +3.2%, -1.5 for -1.5%", font=('Arial', 9), 
-                bg='#2a2a2a', fg='#888').grid(row=row, column=2, sticky='w', padx=5, pady=10)
+        tk.Label(container, text="Price Change (%) *", font=('Arial', 12, 'bold')).grid(row=row, column=0, sticky='w', pady=10)
+        self.price_change_pct_var = tk.StringVar(value="3.2")
+        tk.Entry(container, textvariable=self.price_change_pct_var, width=15,
+                font=('Arial', 12)).grid(row=row, column=1, sticky='w', padx=10, pady=10)
+        tk.Label(container, text="e.g., 3.2 for +3.2%, -1.5 for -1.5%", font=('Arial', 9), fg=_MUTED).grid(row=row, column=2, sticky='w', padx=5, pady=10)
         
         row += 1
         
         # Auto-calculate button
         calc_button = tk.Button(container, text="Auto-Calculate Change %", 
                                command=self.calculate_percentage,
-                               bg='#00ff88', fg='black', font=('Arial', 10, 'bold'),
+                               bg=_ACCENT, fg='black', font=('Arial', 10, 'bold'),
                                padx=20, pady=5)
         calc_button.grid(row=row, column=1, sticky='w', padx=10, pady=20)
         
         row += 1
         
         # Visual Options
-        tk.Label(container, text="Visual Options", font=('Arial', 14, 'bold'), 
-                bg='#2a2a2a', fg='#00ff88').grid(row=row, column=0, columnspan=3, sticky='w', pady=(30,10))
+        tk.Label(container, text="Visual Options", font=('Arial', 14, 'bold'), fg=_ACCENT).grid(row=row, column=0, columnspan=3, sticky='w', pady=(30,10))
         
         row += 1
         
         # YOLO Style
         self.is_yolo_var = tk.BooleanVar(value=False)
-        tk.Checkbutton(container, text="YOLO Style (glowing purple effect)", 
-                      variable=self.is_yolo_var, bg='#2a2a2a', fg='white',
-                      font=('Arial', 11), selectcolor='#3a3a3a').grid(row=row, column=0, columnspan=2, sticky='w', pady=5)
+        tk.Checkbutton(container, text="YOLO Style (glowing purple effect)",
+                      variable=self.is_yolo_var,
+                      font=('Arial', 11)).grid(row=row, column=0, columnspan=2, sticky='w', pady=5)
         
         row += 1
         
         # Border Style
-        tk.Label(container, text="Border Style", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=row, column=0, sticky='w', pady=5)
+        tk.Label(container, text="Border Style", font=('Arial', 11, 'bold')).grid(row=row, column=0, sticky='w', pady=5)
         self.border_style_var = tk.StringVar(value="solid")
         border_combo = ttk.Combobox(container, textvariable=self.border_style_var, width=15,
-                                   values=["solid", "dashed"])
+                                   values=_BORDER_STYLES)
         border_combo.grid(row=row, column=1, sticky='w', padx=10, pady=5)
-        tk.Label(container, text="dashed = pre-market style", font=('Arial', 9), 
-                bg='#2a2a2a', fg='#888').grid(row=row, column=2, sticky='w', padx=5, pady=5)
+        tk.Label(container, text="dashed = pre-market style", font=('Arial', 9), fg=_MUTED).grid(row=row, column=2, sticky='w', padx=5, pady=5)
         
     def calculate_percentage(self):
         try:
-            current_price = self.price_var.get()
-            price_change = self.price_change_var.get()
+            current_price = float(self.price_var.get())
+            price_change = float(self.price_change_var.get())
             if current_price > 0:
                 percentage = (price_change / current_price) * 100
                 self.price_change_pct_var.set(round(percentage, 2))
@@ -256,205 +501,144 @@ class SignalGeneratorGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Invalid price data: {e}")
     
-    def create_key_stats_tab(self):
-        frame = tk.Frame(self.notebook, bg='#2a2a2a')
-        self.notebook.add(frame, text="Key Stats")
-        
-        container = tk.Frame(frame, bg='#2a2a2a')
+    def create_key_stats_tab(self, frame):
+        container = tk.Frame(frame)
         container.pack(expand=True, fill='both', padx=20, pady=20)
         
-        tk.Label(container, text="Key Statistics (exactly 3 for mobile layout)", 
-                font=('Arial', 14, 'bold'), bg='#2a2a2a', fg='#00ff88').pack(pady=10)
+        tk.Label(container, text="Key Statistics (exactly 3 for mobile layout)",
+                font=('Arial', 14, 'bold'), fg=_ACCENT).pack(pady=10)
         
         # Create 3 stat frames
-        self.stat_vars = []
-        for i in range(3):
-            stat_frame = tk.LabelFrame(container, text=f"Stat {i+1}", 
-                                     bg='#3a3a3a', fg='white', font=('Arial', 11, 'bold'))
-            stat_frame.pack(fill='x', pady=10)
-            
-            stat_dict = {}
-            
-            # Value
-            tk.Label(stat_frame, text="Value:", bg='#3a3a3a', fg='white', 
-                    font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky='w', padx=5, pady=5)
-            stat_dict['value'] = tk.StringVar(value="" if i > 0 else ["$185", "15%", "2.5M"][i])
-            tk.Entry(stat_frame, textvariable=stat_dict['value'], width=15, 
-                    bg='#2a2a2a', fg='white').grid(row=0, column=1, sticky='w', padx=5, pady=5)
-            
-            # Label
-            tk.Label(stat_frame, text="Label:", bg='#3a3a3a', fg='white', 
-                    font=('Arial', 10, 'bold')).grid(row=0, column=2, sticky='w', padx=5, pady=5)
-            stat_dict['label'] = tk.StringVar(value="" if i > 0 else ["Target", "Beat Est", "Volume"][i])
-            tk.Entry(stat_frame, textvariable=stat_dict['label'], width=15, 
-                    bg='#2a2a2a', fg='white').grid(row=0, column=3, sticky='w', padx=5, pady=5)
-            
-            # Positive/Negative
-            stat_dict['is_positive'] = tk.BooleanVar(value=True)
-            tk.Checkbutton(stat_frame, text="Positive (green)", variable=stat_dict['is_positive'], 
-                         bg='#3a3a3a', fg='white', selectcolor='#2a2a2a').grid(row=0, column=4, padx=5, pady=5)
-            
-            self.stat_vars.append(stat_dict)
+        self.stat_vars = [
+            self._build_stat_row(container, i, value, label)
+            for i, (value, label) in enumerate(_STAT_DEFAULTS)
+        ]
         
         # Examples
-        examples_frame = tk.LabelFrame(container, text="Examples", 
-                                     bg='#3a3a3a', fg='white', font=('Arial', 11, 'bold'))
+        examples_frame = tk.LabelFrame(container, text="Examples")
         examples_frame.pack(fill='x', pady=20)
         
-        examples_text = """
-IPO: ["223%", "Day 1 High"] | ["$6.8B", "Valuation"] | ["46M", "Volume"]
-Options: ["$3.20", "Credit"] | ["72%", "PoP"] | ["21d", "DTE"]  
-Crypto: ["5.2%", "APY"] | ["$4.2K", "Target"] | ["85", "RSI"]
-FDA: ["+180%", "If Pass"] | ["-65%", "If Fail"] | ["220%", "IV"]
-        """
-        
-        tk.Label(examples_frame, text=examples_text, bg='#3a3a3a', fg='#aaa', 
+        tk.Label(examples_frame, text=_KEY_STATS_EXAMPLES, bg=_BG_RAISED, fg=_DIM,
                 font=('Arial', 9), justify='left').pack(padx=10, pady=10)
     
-    def create_strategy_tab(self):
-        frame = tk.Frame(self.notebook, bg='#2a2a2a')
-        self.notebook.add(frame, text="Strategy")
+    def _build_stat_row(self, parent, index, default_value, default_label):
+        """Build one key stat group and return its form variables"""
+        # Colors and fonts come from the *Stat option defaults
+        stat_frame = tk.LabelFrame(parent, class_='Stat', text=f"Stat {index+1}")
+        stat_frame.pack(fill='x', pady=10)
+        
+        stat_dict = {
+            'value': tk.StringVar(value=default_value),
+            'label': tk.StringVar(value=default_label),
+            'is_positive': tk.BooleanVar(value=True),
+        }
+        
+        # Value, Label and Positive/Negative fields share one grid row
+        _grid_row(
+            0,
+            tk.Label(stat_frame, text="Value:"),
+            tk.Entry(stat_frame, textvariable=stat_dict['value'], width=15),
+            tk.Label(stat_frame, text="Label:"),
+            tk.Entry(stat_frame, textvariable=stat_dict['label'], width=15),
+            tk.Checkbutton(stat_frame, text="Positive (green)", variable=stat_dict['is_positive']),
+            sticky='w', padx=5, pady=5,
+        )
         
-        container = tk.Frame(frame, bg='#2a2a2a')
+        return stat_dict
+    
+    def create_strategy_tab(self, frame):
+        container = tk.Frame(frame)
         container.pack(expand=True, fill='both', padx=20, pady=20)
         
         # Strategy Title
-        tk.Label(container, text="Strategy Title *", font=('Arial', 12, 'bold'), 
-                bg='#2a2a2a', fg='white').pack(anchor='w', pady=5)
+        tk.Label(container, text="Strategy Title *", font=('Arial', 12, 'bold')).pack(anchor='w', pady=5)
         self.strategy_title_var = tk.StringVar(value="Earnings Momentum Play")
-        tk.Entry(container, textvariable=self.strategy_title_var, width=60, 
-                font=('Arial', 11), bg='#3a3a3a', fg='white').pack(fill='x', pady=5)
+        tk.Entry(container, textvariable=self.strategy_title_var, width=60,
+                font=('Arial', 11)).pack(fill='x', pady=5)
         
         # Strategy Description
-        tk.Label(container, text="Strategy Description *", font=('Arial', 12, 'bold'), 
-                bg='#2a2a2a', fg='white').pack(anchor='w', pady=(20,5))
+        tk.Label(container, text="Strategy Description *", font=('Arial', 12, 'bold')).pack(anchor='w', pady=(20,5))
         self.strategy_desc_text = scrolledtext.ScrolledText(container, width=70, height=8, 
-                                                          bg='#3a3a3a', fg='white', font=('Arial', 10))
+                                                          bg=_BG_RAISED, fg='white', font=('Arial', 10))
         self.strategy_desc_text.pack(fill='both', expand=True, pady=5)
         self.strategy_desc_text.insert('1.0', "Beat earnings by 15%. Strong guidance raise. Buy at open for continuation momentum. Historical 3-day avg after beats is +5%.")
         
         # Link Text and URL
-        link_frame = tk.Frame(container, bg='#2a2a2a')
+        link_frame = tk.Frame(container)
         link_frame.pack(fill='x', pady=20)
         
-        tk.Label(link_frame, text="Link Text:", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=0, column=0, sticky='w', padx=5)
+        tk.Label(link_frame, text="Link Text:", font=('Arial', 11, 'bold')).grid(row=0, column=0, sticky='w', padx=5)
         self.strategy_link_text_var = tk.StringVar(value="ER playbook →")
-        tk.Entry(link_frame, textvariable=self.strategy_link_text_var, width=25, 
-                font=('Arial', 10), bg='#3a3a3a', fg='white').grid(row=0, column=1, sticky='w', padx=5)
+        tk.Entry(link_frame, textvariable=self.strategy_link_text_var, width=25,
+                font=('Arial', 10)).grid(row=0, column=1, sticky='w', padx=5)
         
-        tk.Label(link_frame, text="Link URL:", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').grid(row=1, column=0, sticky='w', padx=5, pady=5)
+        tk.Label(link_frame, text="Link URL:", font=('Arial', 11, 'bold')).grid(row=1, column=0, sticky='w', padx=5, pady=5)
         self.strategy_link_url_var = tk.StringVar(value="https://example.com/earnings-strategy")
-        tk.Entry(link_frame, textvariable=self.strategy_link_url_var, width=50, 
-                font=('Arial', 10), bg='#3a3a3a', fg='white').grid(row=1, column=1, sticky='w', padx=5, pady=5)
+        tk.Entry(link_frame, textvariable=self.strategy_link_url_var, width=50,
+                font=('Arial', 10)).grid(row=1, column=1, sticky='w', padx=5, pady=5)
         
         # Strategy Examples
-        examples_frame = tk.LabelFrame(container, text="Strategy Examples by Signal Type", 
-                                     bg='#3a3a3a', fg='white', font=('Arial', 11, 'bold'))
+        examples_frame = tk.LabelFrame(container, text="Strategy Examples by Signal Type")
         examples_frame.pack(fill='x', pady=20)
         
-        examples_text = """
-IPO: "Stablecoin leader 3x'd on debut. ARK bought $150M. Watch for dip to $60-65 for entry."
-YOLO: "Kalshi shows 75% odds of 150K by Q4. High risk, high reward - only risk what you can lose!"
-Pre-Market: "TSMC production boost news. Pre-market up 6.8% on heavy volume. Buy at 9:28-9:30."
-Options: "Post-earnings IV crush. Sell put spread for credit. 72% probability of profit."
-Crypto: "Shanghai upgrade complete. Staking APY 5.2% + price appreciation. DeFi TVL surging."
-FDA: "Alzheimer's drug PDUFA date 7/28. Binary event - ultra high risk, total loss possible."
-        """
-        
-        tk.Label(examples_frame, text=examples_text, bg='#3a3a3a', fg='#aaa', 
+        tk.Label(examples_frame, text=_STRATEGY_EXAMPLES, bg=_BG_RAISED, fg=_DIM,
                 font=('Arial', 9), justify='left').pack(padx=10, pady=10)
     
-    def create_chart_tab(self):
-        frame = tk.Frame(self.notebook, bg='#2a2a2a')
-        self.notebook.add(frame, text="Chart Data")
-        
-        container = tk.Frame(frame, bg='#2a2a2a')
+    def create_chart_tab(self, frame):
+        container = tk.Frame(frame)
         container.pack(expand=True, fill='both', padx=20, pady=20)
         
         # Chart Pattern
-        tk.Label(container, text="Chart Pattern", font=('Arial', 12, 'bold'), 
-                bg='#2a2a2a', fg='white').pack(anchor='w', pady=5)
+        tk.Label(container, text="Chart Pattern", font=('Arial', 12, 'bold')).pack(anchor='w', pady=5)
         self.chart_pattern_var = tk.StringVar(value="momentum")
         pattern_combo = ttk.Combobox(container, textvariable=self.chart_pattern_var, width=20,
-                                   values=["momentum", "volatile", "breakout", "decline"])
+                                   values=_PATTERNS)
         pattern_combo.pack(anchor='w', pady=5)
         
         # Pattern descriptions
-        pattern_desc = """
-momentum: Strong upward trend
-volatile: High volatility swings  
-breakout: Consolidation then breakout
-decline: Downward trend
-        """
-        tk.Label(container, text=pattern_desc, bg='#2a2a2a', fg='#888', 
+        tk.Label(container, text=_CHART_PATTERN_DESCRIPTIONS, fg=_MUTED,
                 font=('Arial', 9), justify='left').pack(anchor='w', pady=10)
         
         # Event Label
-        tk.Label(container, text="Event Label", font=('Arial', 12, 'bold'), 
-                bg='#2a2a2a', fg='white').pack(anchor='w', pady=(20,5))
+        tk.Label(container, text="Event Label", font=('Arial', 12, 'bold')).pack(anchor='w', pady=(20,5))
         self.event_label_var = tk.StringVar(value="Earnings beat")
-        tk.Entry(container, textvariable=self.event_label_var, width=40, 
-                font=('Arial', 11), bg='#3a3a3a', fg='white').pack(anchor='w', pady=5)
+        tk.Entry(container, textvariable=self.event_label_var, width=40,
+                font=('Arial', 11)).pack(anchor='w', pady=5)
         
         # Event label examples
-        event_examples = """
-Examples:
-• IPO: "IPO $31 → $103 peak"
-• YOLO: "Kalshi 75% → 150K" 
-• Pre-market: "Taiwan news 4AM"
-• FDA: "FDA 7/28"
-• Options: "IV Crush Play"
-        """
-        tk.Label(container, text=event_examples, bg='#2a2a2a', fg='#888', 
+        tk.Label(container, text=_EVENT_LABEL_EXAMPLES, fg=_MUTED,
                 font=('Arial', 9), justify='left').pack(anchor='w', pady=10)
         
         # Chart generation info
-        info_frame = tk.LabelFrame(container, text="Chart Generation Info", 
-                                 bg='#3a3a3a', fg='white', font=('Arial', 11, 'bold'))
+        info_frame = tk.LabelFrame(container, text="Chart Generation Info")
         info_frame.pack(fill='x', pady=20)
         
-        info_text = """
-Charts are automatically generated with:
-• Historical data (20 points) - solid line showing past price action
-• Prediction bands - dashed lines showing bull/bear scenarios  
-• Event marker - shows catalyst or signal trigger point
-• Mobile optimization - 100px height for mobile screens
-        """
-        
-        tk.Label(info_frame, text=info_text, bg='#3a3a3a', fg='#aaa', 
+        tk.Label(info_frame, text=_CHART_INFO_TEXT, bg=_BG_RAISED, fg=_DIM,
                 font=('Arial', 9), justify='left').pack(padx=10, pady=10)
     
-    def create_generate_tab(self):
-        frame = tk.Frame(self.notebook, bg='#2a2a2a')
-        self.notebook.add(frame, text="Generate")
-        
-        container = tk.Frame(frame, bg='#2a2a2a')
+    def create_generate_tab(self, frame):
+        container = tk.Frame(frame)
         container.pack(expand=True, fill='both', padx=20, pady=20)
         
         # Output options
-        tk.Label(container, text="Output Options", font=('Arial', 14, 'bold'), 
-                bg='#2a2a2a', fg='#00ff88').pack(pady=10)
+        tk.Label(container, text="Output Options", font=('Arial', 14, 'bold'), fg=_ACCENT).pack(pady=10)
         
         # Filename
-        filename_frame = tk.Frame(container, bg='#2a2a2a')
+        filename_frame = tk.Frame(container)
         filename_frame.pack(fill='x', pady=10)
         
-        tk.Label(filename_frame, text="Filename:", font=('Arial', 11, 'bold'), 
-                bg='#2a2a2a', fg='white').pack(side='left')
+        tk.Label(filename_frame, text="Filename:", font=('Arial', 11, 'bold')).pack(side='left')
         self.filename_var = tk.StringVar(value="")
-        tk.Entry(filename_frame, textvariable=self.filename_var, width=40, 
-                font=('Arial', 11), bg='#3a3a3a', fg='white').pack(side='left', padx=10)
-        tk.Label(filename_frame, text="(leave empty for auto-generation)", font=('Arial', 9), 
-                bg='#2a2a2a', fg='#888').pack(side='left', padx=5)
+        tk.Entry(filename_frame, textvariable=self.filename_var, width=40,
+                font=('Arial', 11)).pack(side='left', padx=10)
+        tk.Label(filename_frame, text="(leave empty for auto-generation)", font=('Arial', 9), fg=_MUTED).pack(side='left', padx=5)
         
         # Generate button
-        generate_button = tk.Button(container, text="🚀 Generate Signal HTML", 
-                                   command=self.generate_signal,
-                                   bg='#00ff88', fg='black', font=('Arial', 14, 'bold'),
-                                   padx=30, pady=15)
-        generate_button.pack(pady=30)
+        self.generate_button = tk.Button(container, text="🚀 Generate Signal HTML", 
+                                        command=self.generate_signal,
+                                        bg=_ACCENT, fg='black', font=('Arial', 14, 'bold'),
+                                        padx=30, pady=15)
+        self.generate_button.pack(pady=30)
         
         # Preview button
         preview_button = tk.Button(container, text="👁️ Preview Data", 
@@ -464,16 +648,17 @@ Charts are automatically generated with:
         preview_button.pack(pady=10)
         
         # Output area
-        output_frame = tk.LabelFrame(container, text="Generation Output", 
-                                   bg='#3a3a3a', fg='white', font=('Arial', 11, 'bold'))
+        output_frame = tk.LabelFrame(container, text="Generation Output")
         output_frame.pack(fill='both', expand=True, pady=20)
         
+        # Write-only log: no undo stack
         self.output_text = scrolledtext.ScrolledText(output_frame, width=70, height=15, 
-                                                   bg='#2a2a2a', fg='#00ff88', font=('Courier', 10))
+                                                   bg=_BG, fg=_ACCENT, font=('Courier', 10),
+                                                   undo=False, autoseparators=False, maxundo=0)
         self.output_text.pack(fill='both', expand=True, padx=10, pady=10)
         
         # Quick actions
-        actions_frame = tk.Frame(container, bg='#2a2a2a')
+        actions_frame = tk.Frame(container)
         actions_frame.pack(fill='x', pady=10)
         
         tk.Button(actions_frame, text="Clear Output", command=self.clear_output,
@@ -485,55 +670,14 @@ Charts are automatically generated with:
     def preview_data(self):
         try:
             signal_data = self.collect_signal_data()
-            
-            preview = f"""
-🎯 Signal Preview:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📊 Basic Info:
-   Ticker: {signal_data.ticker}
-   Company: {signal_data.company_name}
-   Signal Type: {signal_data.signal_type.name}
-   Priority: {signal_data.priority.name}
-   Timestamp: {signal_data.timestamp}
-
-💰 Price Data:
-   Current Price: ${signal_data.current_price:,.2f}
-   Price Change: ${signal_data.price_change:+,.2f}
-   Change %: {signal_data.price_change_percent:+.2f}%
-
-📈 Key Stats:
-"""
-            for i, stat in enumerate(signal_data.key_stats, 1):
-                preview += f"   {i}. {stat.value} - {stat.label} {'(+)' if stat.is_positive else '(-)'}\n"
-            
-            preview += f"""
-🧠 Strategy:
-   Title: {signal_data.strategy.title}
-   Description: {signal_data.strategy.description[:100]}...
-   Link: {signal_data.strategy.link_text}
-
-📊 Chart:
-   Pattern: {signal_data.chart_data.event_label if signal_data.chart_data else 'Auto-generated'}
-   
-🎨 Visual:
-   YOLO Style: {'Yes' if signal_data.is_yolo else 'No'}
-   Border: {signal_data.border_style}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-            
-            self.output_text.delete('1.0', tk.END)
-            self.output_text.insert('1.0', preview)
+            self.output_text.replace('1.0', tk.END, format_preview(signal_data))
             
         except Exception as e:
             messagebox.showerror("Preview Error", f"Error creating preview: {e}")
     
     def collect_signal_data(self):
-        # Validate required fields
-        if not self.ticker_var.get().strip():
-            raise ValueError("Ticker symbol is required")
-        if not self.company_var.get().strip():
-            raise ValueError("Company name is required")
+        # Unvisited tabs contribute their default values
+        self.build_all_tabs()
         
         # Collect key stats
         key_stats = []
@@ -551,27 +695,19 @@ Charts are automatically generated with:
             link_url=self.strategy_link_url_var.get().strip()
         )
         
-        # Generate chart data
-        current_price = self.price_var.get()
-        chart_data = generate_chart_data(
-            self.ticker_var.get(), 
-            current_price, 
-            self.chart_pattern_var.get()
-        )
-        chart_data.event_label = self.event_label_var.get().strip() or f"Signal @ ${current_price:.2f}"
-        
-        # Create signal data
-        signal_data = SignalData(
+        # Read each form variable once; validation happens in build_signal
+        signal_data = build_signal(
             ticker=self.ticker_var.get().strip().upper(),
             company_name=self.company_var.get().strip(),
-            signal_type=SignalType[self.signal_type_var.get()],
-            current_price=current_price,
+            signal_type=self.signal_type_var.get(),
+            priority=self.priority_var.get(),
+            current_price=self.price_var.get(),
             price_change=self.price_change_var.get(),
             price_change_percent=self.price_change_pct_var.get(),
-            priority=SignalPriority[self.priority_var.get()],
             key_stats=key_stats,
             strategy=strategy,
-            chart_data=chart_data,
+            chart_pattern=self.chart_pattern_var.get(),
+            event_label=self.event_label_var.get().strip(),
             timestamp=self.timestamp_var.get().strip(),
             is_yolo=self.is_yolo_var.get(),
             border_style=self.border_style_var.get()
@@ -581,117 +717,115 @@ Charts are automatically generated with:
     
     def generate_signal(self):
         try:
-            self.output_text.delete('1.0', tk.END)
-            self.output_text.insert(tk.END, "🎨 Generating signal HTML...\n\n")
-            self.root.update()
+            self.output_text.replace('1.0', tk.END, "🎨 Generating signal HTML...\n\n")
+            self.root.update_idletasks()
             
             # Collect signal data
             signal_data = self.collect_signal_data()
             
             # Generate filename if not provided
-            filename = self.filename_var.get().strip()
-            if not filename:
-                filename = f"{signal_data.ticker}_{signal_data.signal_type.name.lower()}.html"
-            elif not filename.endswith('.html'):
-                filename += '.html'
+            filename = output_filename(signal_data, self.filename_var.get().strip())
             
-            # Generate HTML
-            output_path = self.renderer.render_signal(signal_data, filename)
-            
-            # Check result
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                abs_path = os.path.abspath(output_path)
-                
-                success_msg = f"""✅ SUCCESS! Signal generated successfully!
-
-📄 File: {filename}
-📁 Path: {output_path}  
-💾 Size: {file_size:,} bytes ({file_size/1024:.1f} KB)
-🌐 Browser: file://{abs_path}
-
-📊 Signal Details:
-   • Ticker: {signal_data.ticker}
-   • Type: {signal_data.signal_type.name}
-   • Price: ${signal_data.current_price:,.2f} ({signal_data.price_change_percent:+.1f}%)
-   • Stats: {len(signal_data.key_stats)} key metrics
-   • Strategy: {signal_data.strategy.title}
-
-🎨 Visual Features:
-   • Mobile-optimized responsive design
-   • Interactive charts with prediction bands
-   • Real-time price updates (every 5s)
-   • Haptic feedback for mobile devices
-   • {'YOLO glow effects' if signal_data.is_yolo else 'Standard styling'}
-   • {signal_data.border_style.title()} border style
-
-🚀 Ready to view in browser!"""
-                
-                self.output_text.insert(tk.END, success_msg)
-                
-                # Show success dialog
-                result = messagebox.askyesno("Success!", 
-                    f"Signal '{signal_data.ticker}' generated successfully!\n\n"
-                    f"File: {filename}\n"
-                    f"Size: {file_size:,} bytes\n\n"
-                    f"Would you like to open it in your browser?")
-                
-                if result:
-                    import webbrowser
-                    webbrowser.open(f"file://{abs_path}")
-                    
-            else:
-                error_msg = "❌ ERROR: File was not generated!"
-                self.output_text.insert(tk.END, error_msg)
-                messagebox.showerror("Error", "Failed to generate HTML file")
-                
+            # Generate HTML, reusing the previous file if nothing changed
+            key = render_key(signal_data, filename, self.chart_pattern_var.get())
+            cached_key, output_path = self._last_render
+            if key == cached_key and os.path.exists(output_path):
+                self.show_generated(signal_data, filename, output_path)
+                return
         except Exception as e:
-            error_msg = f"❌ GENERATION ERROR:\n\n{str(e)}\n\nPlease check your input data."
+            self.show_generation_error(e)
+            return
+        
+        # Render and write the file off the Tk thread; the worker only queues
+        # the finished future, and the Tk thread picks it up in _poll_renders
+        self.generate_button.configure(state='disabled')
+        future = _EXECUTOR.submit(self.renderer.render_signal, signal_data, filename)
+        future.add_done_callback(
+            lambda fut: self._render_results.put((fut, signal_data, filename, key))
+        )
+        self._pending_renders += 1
+        if self._pending_renders == 1:
+            self.root.after(_RENDER_POLL_MS, self._poll_renders)
+    
+    def _poll_renders(self):
+        """Report finished renders; runs on the Tk thread via after()"""
+        while True:
+            try:
+                done = self._render_results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_renders -= 1
+            self._on_generate_done(*done)
+        
+        if self._pending_renders:
+            self.root.after(_RENDER_POLL_MS, self._poll_renders)
+    
+    def _on_generate_done(self, future, signal_data, filename, key):
+        self.generate_button.configure(state='normal')
+        try:
+            output_path = future.result()
+        except Exception as e:
+            self.show_generation_error(e)
+            return
+        
+        self._last_render = (key, output_path)
+        self.show_generated(signal_data, filename, output_path)
+    
+    def show_generated(self, signal_data, filename, output_path):
+        """Report a rendered signal file in the output log"""
+        try:
+            file_size = os.stat(output_path).st_size
+        except FileNotFoundError:
+            error_msg = "❌ ERROR: File was not generated!"
             self.output_text.insert(tk.END, error_msg)
-            messagebox.showerror("Generation Error", f"Error: {e}")
+            self.notifier.error("Failed to generate HTML file")
+            return
+        
+        abs_path = os.path.abspath(output_path)
+        
+        self.output_text.insert(tk.END, format_success(signal_data, filename, output_path, file_size, abs_path))
+        
+        # Show success dialog
+        result = messagebox.askyesno("Success!", 
+            f"Signal '{signal_data.ticker}' generated successfully!\n\n"
+            f"File: {filename}\n"
+            f"Size: {file_size:,} bytes\n\n"
+            f"Would you like to open it in your browser?")
+        
+        if result:
+            webbrowser.open(f"file://{abs_path}")
+    
+    def show_generation_error(self, error):
+        """Report a failed generation in the output log"""
+        error_msg = f"❌ GENERATION ERROR:\n\n{str(error)}\n\nPlease check your input data."
+        self.output_text.insert(tk.END, error_msg)
+        self.notifier.error(f"Error: {error}")
     
     def clear_output(self):
         self.output_text.delete('1.0', tk.END)
     
     def open_output_folder(self):
-        output_dir = os.path.abspath("gui_generated")
+        output_dir = _OUTPUT_DIR
         if os.path.exists(output_dir):
-            import subprocess
-            import sys
-            if sys.platform == "win32":
-                os.startfile(output_dir)
-            elif sys.platform == "darwin":
-                subprocess.call(["open", output_dir])
-            else:
-                subprocess.call(["xdg-open", output_dir])
+            _open_folder(output_dir)
         else:
-            messagebox.showinfo("Info", f"Output directory doesn't exist yet: {output_dir}")
+            self.notifier.info(f"Output directory doesn't exist yet: {output_dir}")
 
 def main():
     root = tk.Tk()
     app = SignalGeneratorGUI(root)
     
-    # Add instructions
-    instructions = """
-Welcome to SignalPro Signal Generator!
-
-📋 Getting Started:
-1. Fill out each tab with your signal data
-2. Use the Preview button to check your data
-3. Click Generate to create the HTML file
-4. Open the file in your browser to view
-
-💡 Tips:
-• Fields marked with * are required
-• Key Stats should have exactly 3 items for mobile layout
-• YOLO signals get special glowing effects
-• Pre-market signals typically use dashed borders
-• All generated files are mobile-optimized
-
-🎯 Ready to create professional trading signals!
-    """
+    # Non-modal, shown once the main window has been drawn
+    def show_welcome():
+        welcome = tk.Toplevel(root, bg=_BG)
+        welcome.title("Welcome")
+        welcome.transient(root)
+        tk.Label(welcome, text=_WELCOME_TEXT, justify='left',
+                font=('Arial', 10)).pack(padx=20, pady=(10, 0))
+        tk.Button(welcome, text="OK", width=10,
+                 command=welcome.destroy).pack(pady=(5, 15))
     
-    messagebox.showinfo("Welcome", instructions)
+    root.after_idle(show_welcome)
     
     root.mainloop()
 
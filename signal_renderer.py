@@ -4,11 +4,16 @@ Generates mobile-friendly trading signal HTML pages from market scan data
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple, Literal
+from typing import List, Optional, Dict, Tuple, Literal, Sequence
 from enum import Enum
-import json
-from datetime import datetime
+import functools
+import html
+import math
+import random
+import string
 import os
+import sys
+import urllib.parse
 
 class SignalType(Enum):
     """Signal types with their associated visual styles"""
@@ -23,6 +28,20 @@ class SignalType(Enum):
     UNUSUAL_OPTIONS = ("indicator-signal", "#d35400", "#d35400")
     MEME_SQUEEZE = ("yolo-play", "linear-gradient(135deg, #ff00ff, #ff4757)", "#ff00ff")
 
+# Per-member values derived once at import:
+# - slug: lowercase member name used in generated filenames, interned so it is
+#   the same object as any matching literal key
+# - card_bg_style: card background CSS; gradients are used as-is, solid colors
+#   fall back to the dark card gradient
+for _signal_type in SignalType:
+    _signal_type.slug = sys.intern(_signal_type.name.lower())
+    _card_bg = _signal_type.value[1]
+    _signal_type.card_bg_style = (
+        f"background: {_card_bg};" if "gradient" in _card_bg
+        else "background: linear-gradient(135deg, #1a1a1a 0%, #2a2a2a 100%);"
+    )
+del _signal_type, _card_bg
+
 class SignalPriority(Enum):
     """Signal priority levels"""
     HOT = "🔥 HOT"
@@ -30,7 +49,14 @@ class SignalPriority(Enum):
     NORMAL = ""
     WATCH = "👀 WATCH"
 
-@dataclass
+# Member lookups by name for form and request payloads (aliases included)
+SIGNAL_TYPES_BY_NAME = SignalType.__members__
+PRIORITIES_BY_NAME = SignalPriority.__members__
+
+# ChartData fields holding the prediction bands
+_BAND_FIELDS = frozenset(("prediction_upper", "prediction_base", "prediction_lower"))
+
+@dataclass(slots=True)
 class ChartData:
     """Chart configuration and data"""
     historical_data: List[float]
@@ -39,23 +65,55 @@ class ChartData:
     prediction_lower: List[float]
     event_label: str
     chart_color: str = "#00ff88"
+    # Price generate_chart_data projected the standard bands from; the page
+    # then projects them itself instead of embedding the three lists. Assigning
+    # any prediction list clears it, so replaced bands are embedded as given
+    # (edit a generated chart's bands by assigning new lists, not in place)
+    _bands_price: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
-@dataclass
+    def __setattr__(self, name, value):
+        if name in _BAND_FIELDS:
+            object.__setattr__(self, "_bands_price", None)
+        object.__setattr__(self, name, value)
+    
+    def to_dict(self) -> Dict:
+        """Plain dict of the chart, without dataclasses.asdict's deep copy"""
+        return {
+            "historical_data": list(self.historical_data),
+            "prediction_upper": list(self.prediction_upper),
+            "prediction_base": list(self.prediction_base),
+            "prediction_lower": list(self.prediction_lower),
+            "event_label": self.event_label,
+            "chart_color": self.chart_color,
+        }
+    
+@dataclass(slots=True)
 class KeyStat:
     """Key statistic display"""
     value: str
     label: str
     is_positive: bool = True
     
-@dataclass
+    def to_dict(self) -> Dict:
+        return {"value": self.value, "label": self.label, "is_positive": self.is_positive}
+    
+@dataclass(slots=True)
 class StrategyInfo:
     """Trading strategy information"""
     title: str
     description: str
     link_text: str = "Learn more →"
     link_url: str = "https://example.com/strategy"
+    
+    def to_dict(self) -> Dict:
+        return {
+            "title": self.title,
+            "description": self.description,
+            "link_text": self.link_text,
+            "link_url": self.link_url,
+        }
 
-@dataclass
+@dataclass(slots=True)
 class SignalData:
     """Complete signal data from market scan engine"""
     # Basic Info
@@ -68,7 +126,7 @@ class SignalData:
     
     # Optional fields with defaults
     priority: SignalPriority = SignalPriority.NORMAL
-    key_stats: List[KeyStat] = field(default_factory=list)
+    key_stats: Sequence[KeyStat] = field(default_factory=list)
     strategy: StrategyInfo = None
     chart_data: ChartData = None
     timestamp: str = "Just now"
@@ -77,61 +135,45 @@ class SignalData:
     has_animation: bool = False
     border_style: Literal["solid", "dashed"] = "solid"
     
-class SignalRenderer:
-    """Universal rendering engine for trading signals"""
-    
-    def __init__(self, output_dir: str = "signals"):
-        self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
-        
-    def render_signal(self, signal: SignalData, filename: str = None) -> str:
-        """
-        Render a signal to HTML
-        
-        Args:
-            signal: SignalData object with all required information
-            filename: Optional output filename (defaults to ticker_signal.html)
-            
-        Returns:
-            Path to generated HTML file
-        """
-        if not filename:
-            filename = f"{signal.ticker.lower()}_{signal.signal_type.name.lower()}.html"
-            
-        html = self._generate_html(signal)
-        
-        output_path = os.path.join(self.output_dir, filename)
-        with open(output_path, 'w') as f:
-            f.write(html)
-            
-        return output_path
+    def to_dict(self) -> Dict:
+        """JSON-ready dict of the signal; enums are given by member name"""
+        return {
+            "ticker": self.ticker,
+            "company_name": self.company_name,
+            "signal_type": self.signal_type.name,
+            "current_price": self.current_price,
+            "price_change": self.price_change,
+            "price_change_percent": self.price_change_percent,
+            "priority": self.priority.name,
+            "key_stats": [stat.to_dict() for stat in self.key_stats],
+            "strategy": self.strategy.to_dict() if self.strategy else None,
+            "chart_data": self.chart_data.to_dict() if self.chart_data else None,
+            "timestamp": self.timestamp,
+            "notifications_enabled": self.notifications_enabled,
+            "is_yolo": self.is_yolo,
+            "has_animation": self.has_animation,
+            "border_style": self.border_style,
+        }
     
-    def _generate_html(self, signal: SignalData) -> str:
-        """Generate complete HTML for a signal"""
-        
-        # Get style configuration
-        badge_class, card_bg, chart_color = signal.signal_type.value
-        
-        # Determine card classes
-        card_classes = ["signal-card"]
-        if signal.is_yolo:
-            card_classes.append("yolo")
-        if signal.border_style == "dashed":
-            card_classes.append("pre-market")
-            
-        # Generate chart JavaScript
-        chart_js = self._generate_chart_js(signal, chart_color)
-        
-        # Build HTML
-        html = f"""<!DOCTYPE html>
+def _floats_to_js_array(values: Sequence[float]) -> str:
+    """JavaScript array literal for a series of chart prices"""
+    # Same 4-place precision, minus the trailing zeros fixed-width pads on
+    return "[" + ",".join([f"{value:.4f}".rstrip("0").rstrip(".") for value in values]) + "]"
+
+def _stat_color_class(stat: KeyStat) -> str:
+    """CSS class coloring a key stat value"""
+    return "positive" if stat.is_positive else "negative" if not stat.is_positive and stat.value.startswith('-') else ""
+
+# Page skeleton, parsed once at import; filled by SignalRenderer._generate_html
+_PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{signal.ticker} - {signal.strategy.title if signal.strategy else signal.signal_type.name}</title>
+    <title>{ticker} - {title}</title>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/4.4.0/chart.umd.js"></script>
     <style>
-{self._get_css(signal)}
+{css}
     </style>
 </head>
 <body>
@@ -145,84 +187,213 @@ class SignalRenderer:
         </a>
     </div>
     
-    <div class="{' '.join(card_classes)}">
-        {self._get_priority_label(signal)}
+    <div class="{card_classes}">
+        {priority_label}
         <div class="signal-header">
             <div class="ticker-main">
-                <span class="ticker">{signal.ticker}</span>
-                <span class="strategy-badge {badge_class}">{signal.signal_type.name.replace('_', ' ')}</span>
+                <span class="ticker">{ticker}</span>
+                <span class="strategy-badge {badge_class}">{badge_text}</span>
             </div>
-            <div class="company-name">{signal.company_name}</div>
+            <div class="company-name">{company_name}</div>
             <div class="price-row">
-                <span class="price">${signal.current_price:,.2f}</span>
-                <span class="change {'positive' if signal.price_change_percent > 0 else 'negative'}">
-                    {'+' if signal.price_change_percent > 0 else ''}{signal.price_change_percent:.1f}%
+                <span class="price">${price:,.2f}</span>
+                <span class="change {change_class}">
+                    {change_sign}{change_percent:.1f}%
                 </span>
             </div>
         </div>
         
-        {self._get_chart_section(signal)}
+        {chart_section}
         
-        {self._get_key_stats(signal)}
+        {key_stats}
         
-        {self._get_strategy_section(signal)}
+        {strategy_section}
         
         <div class="signal-footer">
             <div class="notify-toggle">
                 <span>Exit alert</span>
-                <div class="toggle {'on' if signal.notifications_enabled else ''} haptic" onclick="toggleNotify(this)">
+                <div class="toggle {toggle_class} haptic" onclick="toggleNotify(this)">
                     <div class="toggle-knob"></div>
                 </div>
             </div>
-            <span>{signal.timestamp}</span>
+            <span>{timestamp}</span>
         </div>
     </div>
 
     <script>
 {chart_js}
-{self._get_javascript()}
+{javascript}
     </script>
 </body>
 </html>"""
+
+# The page skeleton pre-split into (literal, field name, format spec) runs so
+# _write_html can stream it section by section
+_PAGE_RUNS = tuple(
+    (literal, name, spec)
+    for literal, name, spec, _conversion in string.Formatter().parse(_PAGE_TEMPLATE)
+)
+
+# Signal-independent page scripts (notification toggle, haptics, price ticker)
+_PAGE_JS = """        
+        // Toggle notification
+        function toggleNotify(element) {
+            element.classList.toggle('on');
+            vibrate();
+        }
         
-        return html
-    
-    def _get_css(self, signal: SignalData) -> str:
-        """Generate CSS styles based on signal type"""
-        
-        _, card_bg, primary_color = signal.signal_type.value
+        // Haptic feedback
+        function vibrate(duration = 10) {
+            if ('vibrate' in navigator) {
+                navigator.vibrate(duration);
+            }
+        }
         
-        # Determine if gradient or solid background
-        if "gradient" in str(card_bg):
-            card_bg_style = f"background: {card_bg};"
-        else:
-            card_bg_style = f"background: linear-gradient(135deg, #1a1a1a 0%, #2a2a2a 100%);"
-            
-        yolo_styles = """
-        .signal-card.yolo {
-            background: linear-gradient(135deg, #1a1a1a 0%, #2d0d2d 100%);
-            border-color: #ff00ff;
-            animation: yolo-glow 3s ease-in-out infinite;
+        // Real-time price updates
+        function updatePrice() {
+            const priceEl = document.querySelector('.price');
+            const changeEl = document.querySelector('.change');
+            if (priceEl) {
+                const current = parseFloat(priceEl.textContent.replace('$', '').replace(',', ''));
+                const change = (Math.random() - 0.5) * 0.02 * current;
+                const newPrice = current + change;
+                
+                if (current > 1000) {
+                    priceEl.textContent = '$' + newPrice.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
+                } else {
+                    priceEl.textContent = '$' + newPrice.toFixed(2);
+                }
+                
+                if (changeEl) {
+                    const percent = ((Math.random() - 0.4) * 5).toFixed(1);
+                    changeEl.textContent = (percent > 0 ? '+' : '') + percent + '%';
+                    changeEl.className = 'change ' + (percent > 0 ? 'positive' : 'negative');
+                }
+            }
         }
         
-        @keyframes yolo-glow {
-            0%, 100% { box-shadow: 0 0 10px rgba(255, 0, 255, 0.3); }
-            50% { box-shadow: 0 0 20px rgba(255, 0, 255, 0.5); }
-        }""" if signal.is_yolo else ""
+        // Initialize
+        document.addEventListener('DOMContentLoaded', () => {
+            // Start price updates
+            setInterval(updatePrice, 5000);
+            
+            // Add haptic to all interactive elements
+            document.querySelectorAll('.haptic').forEach(el => {
+                el.addEventListener('click', () => vibrate());
+            });
+        });
         
-        pre_market_styles = """
-        .signal-card.pre-market {
-            border-style: dashed;
-            border-color: #ffd93d;
-        }""" if signal.border_style == "dashed" else ""
+        // PWA Support
+        if ('serviceWorker' in navigator) {
+            navigator.serviceWorker.register('/sw.js').catch(() => {});
+        }"""
+
+# Chart.js setup for the card; only the ticker, color and price series vary
+_CHART_JS_TEMPLATE = """        // Mini chart configuration
+        const miniChartOptions = {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: { display: false },
+                tooltip: { enabled: false }
+            },
+            scales: {
+                x: { 
+                    display: false,
+                    grid: { display: false }
+                },
+                y: { 
+                    display: false,
+                    grid: { display: false }
+                }
+            },
+            elements: {
+                point: { radius: 0 },
+                line: { borderWidth: 2 }
+            },
+            interaction: {
+                intersect: false
+            }
+        };
         
-        return f"""        * {{
+        // Initialize chart with prediction bands
+        const chartCtx = document.getElementById('chart-%(ticker)s')?.getContext('2d');
+        if (chartCtx) {
+            const currentPrice = %(current_price)r;
+%(bands)s            new Chart(chartCtx, {
+                type: 'line',
+                data: {
+                    labels: Array.from({length: 40}, (_, i) => i - 20),
+                    datasets: [
+                        {
+                            label: 'Historical',
+                            data: %(historical)s.concat(Array(20).fill(null)),
+                            borderColor: '%(chart_color)s',
+                            backgroundColor: 'transparent',
+                            borderWidth: 2,
+                            pointRadius: 0,
+                            tension: 0.3
+                        },
+                        {
+                            label: 'Upper Band',
+                            data: Array(20).fill(null).concat(%(upper)s),
+                            borderColor: 'rgba(255, 71, 87, 0.3)',
+                            borderDash: [5, 5],
+                            borderWidth: 1,
+                            pointRadius: 0,
+                            fill: '+1',
+                            backgroundColor: 'rgba(255, 71, 87, 0.1)'
+                        },
+                        {
+                            label: 'Base Case',
+                            data: Array(20).fill(null).concat(%(base)s),
+                            borderColor: '%(chart_color)s',
+                            borderDash: [5, 5],
+                            borderWidth: 2,
+                            pointRadius: 0
+                        },
+                        {
+                            label: 'Lower Band',
+                            data: Array(20).fill(null).concat(%(lower)s),
+                            borderColor: 'rgba(255, 71, 87, 0.3)',
+                            borderDash: [5, 5],
+                            borderWidth: 1,
+                            pointRadius: 0,
+                            fill: false
+                        }
+                    ]
+                },
+                options: miniChartOptions
+            });
+        }"""
+
+# Browser-side twin of generate_chart_data's prediction bands, used in place
+# of three embedded arrays for charts built by generate_chart_data
+_PREDICTION_BANDS_JS = """            const bands = { upper: [], base: [], lower: [] };
+            for (let i = 0, price = %r; i < %d; i++) {
+                const progress = i / %d;
+                bands.upper.push(price + price * 0.3 * progress + Math.pow(i, 1.1));
+                bands.base.push(price + price * 0.1 * progress);
+                bands.lower.push(price - price * 0.2 * progress - Math.pow(i, 1.05));
+            }
+"""
+
+# Card element classes keyed by (YOLO glow, dashed border)
+_CARD_CLASSES = {
+    (False, False): "signal-card",
+    (True, False): "signal-card yolo",
+    (False, True): "signal-card pre-market",
+    (True, True): "signal-card yolo pre-market",
+}
+
+# Static page CSS around the per-variant values
+_CSS_BASE = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: #000000;
             color: #ffffff;
@@ -231,18 +402,18 @@ class SignalRenderer:
             margin: 0 auto;
             min-height: 100vh;
             -webkit-font-smoothing: antialiased;
-        }}
+        }
         
         /* Header */
-        .header {{
+        .header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             padding: 15px 5px;
             margin-bottom: 15px;
-        }}
+        }
         
-        .logo {{
+        .logo {
             font-size: 22px;
             font-weight: bold;
             background: linear-gradient(45deg, #00ff88, #00d4ff, #ff00ff);
@@ -251,9 +422,9 @@ class SignalRenderer:
             display: flex;
             align-items: center;
             gap: 5px;
-        }}
+        }
         
-        .back-button {{
+        .back-button {
             display: flex;
             align-items: center;
             gap: 5px;
@@ -262,38 +433,46 @@ class SignalRenderer:
             font-size: 14px;
             font-weight: 500;
             transition: opacity 0.3s;
-        }}
+        }
         
-        .back-button:hover {{
+        .back-button:hover {
             opacity: 0.8;
-        }}
+        }
         
         /* Signal Card */
-        .signal-card {{
-            {card_bg_style}
+        .signal-card {
+            """
+
+_CSS_CARD_BORDER = """
             border-radius: 16px;
             padding: 16px;
-            border: 1px solid {primary_color};
+            border: 1px solid """
+
+_CSS_VARIANT_SEP = """;
             position: relative;
             overflow: hidden;
             animation: fadeIn 0.5s ease;
-        }}
+        }
         
-        {yolo_styles}
-        {pre_market_styles}
+        """
+
+_CSS_VARIANT_GAP = """
+        """
+
+_CSS_RESPONSIVE = """
         
-        @keyframes fadeIn {{
-            from {{
+        @keyframes fadeIn {
+            from {
                 opacity: 0;
                 transform: translateY(10px);
-            }}
-            to {{
+            }
+            to {
                 opacity: 1;
                 transform: translateY(0);
-            }}
-        }}
+            }
+        }
         
-        .hot-label {{
+        .hot-label {
             position: absolute;
             top: 10px;
             right: 10px;
@@ -305,93 +484,93 @@ class SignalRenderer:
             border-radius: 10px;
             text-transform: uppercase;
             animation: hot-pulse 2s infinite;
-        }}
+        }
         
-        @keyframes hot-pulse {{
-            0%, 100% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.1); }}
-        }}
+        @keyframes hot-pulse {
+            0%, 100% { transform: scale(1); }
+            50% { transform: scale(1.1); }
+        }
         
-        .signal-header {{
+        .signal-header {
             margin-bottom: 12px;
-        }}
+        }
         
-        .ticker-main {{
+        .ticker-main {
             display: flex;
             align-items: center;
             gap: 8px;
             margin-bottom: 4px;
-        }}
+        }
         
-        .ticker {{
+        .ticker {
             font-size: 20px;
             font-weight: bold;
-        }}
+        }
         
-        .strategy-badge {{
+        .strategy-badge {
             padding: 4px 10px;
             border-radius: 12px;
             font-size: 10px;
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
         /* Strategy Badge Colors */
-        .ipo-debut {{ background: linear-gradient(135deg, #ff4757, #ff6348); }}
-        .yolo-play {{ 
+        .ipo-debut { background: linear-gradient(135deg, #ff4757, #ff6348); }
+        .yolo-play { 
             background: linear-gradient(135deg, #ff00ff, #ff4757); 
             animation: color-shift 3s infinite;
-        }}
-        .pre-market {{ background: #ffd93d; color: #000; }}
-        .stock-split {{ background: #3498db; }}
-        .option-spread {{ background: #e74c3c; }}
-        .crypto-play {{ background: #f7931a; color: #000; }}
-        .fda-event {{ background: #16a085; }}
-        .post-market {{ background: #95a5a6; }}
-        .indicator-signal {{ background: #d35400; }}
-        
-        @keyframes color-shift {{
-            0%, 100% {{ filter: hue-rotate(0deg); }}
-            50% {{ filter: hue-rotate(30deg); }}
-        }}
+        }
+        .pre-market { background: #ffd93d; color: #000; }
+        .stock-split { background: #3498db; }
+        .option-spread { background: #e74c3c; }
+        .crypto-play { background: #f7931a; color: #000; }
+        .fda-event { background: #16a085; }
+        .post-market { background: #95a5a6; }
+        .indicator-signal { background: #d35400; }
+        
+        @keyframes color-shift {
+            0%, 100% { filter: hue-rotate(0deg); }
+            50% { filter: hue-rotate(30deg); }
+        }
         
-        .company-name {{
+        .company-name {
             font-size: 12px;
             color: #666;
             margin-bottom: 6px;
-        }}
+        }
         
-        .price-row {{
+        .price-row {
             display: flex;
             align-items: baseline;
             gap: 8px;
-        }}
+        }
         
-        .price {{
+        .price {
             font-size: 24px;
             font-weight: bold;
-        }}
+        }
         
-        .change {{
+        .change {
             font-size: 14px;
             font-weight: 600;
-        }}
+        }
         
-        .positive {{ color: #00ff88; }}
-        .negative {{ color: #ff4757; }}
+        .positive { color: #00ff88; }
+        .negative { color: #ff4757; }
         
         /* Chart Section */
-        .chart-section {{
+        .chart-section {
             height: 100px;
             margin-bottom: 12px;
             position: relative;
             background: rgba(255, 255, 255, 0.02);
             border-radius: 10px;
             padding: 8px;
-        }}
+        }
         
-        .chart-section::after {{
+        .chart-section::after {
             content: '';
             position: absolute;
             top: 10%;
@@ -400,9 +579,9 @@ class SignalRenderer:
             height: 80%;
             background: rgba(255, 255, 255, 0.2);
             border-left: 1px dashed rgba(255, 255, 255, 0.3);
-        }}
+        }
         
-        .event-label {{
+        .event-label {
             position: absolute;
             top: 8px;
             right: 8px;
@@ -413,9 +592,9 @@ class SignalRenderer:
             backdrop-filter: blur(10px);
             border: 1px solid rgba(255, 255, 255, 0.1);
             z-index: 10;
-        }}
+        }
         
-        .prediction-indicator {{
+        .prediction-indicator {
             position: absolute;
             bottom: 4px;
             left: 50%;
@@ -424,59 +603,59 @@ class SignalRenderer:
             color: #666;
             letter-spacing: 0.5px;
             text-transform: uppercase;
-        }}
+        }
         
         /* Key Stats */
-        .key-stats {{
+        .key-stats {
             display: grid;
             grid-template-columns: repeat(3, 1fr);
             gap: 8px;
             margin-bottom: 12px;
-        }}
+        }
         
-        .stat {{
+        .stat {
             text-align: center;
             padding: 8px 4px;
             background: rgba(255, 255, 255, 0.05);
             border-radius: 8px;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 16px;
             font-weight: bold;
             margin-bottom: 2px;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 10px;
             color: #666;
             text-transform: uppercase;
-        }}
+        }
         
         /* Strategy Info */
-        .strategy-info {{
+        .strategy-info {
             background: rgba(255, 255, 255, 0.03);
             border-radius: 10px;
             padding: 12px;
             margin-bottom: 12px;
             border: 1px solid rgba(255, 255, 255, 0.08);
-        }}
+        }
         
-        .strategy-title {{
+        .strategy-title {
             font-size: 13px;
             font-weight: 600;
             margin-bottom: 6px;
             color: #00d4ff;
-        }}
+        }
         
-        .strategy-desc {{
+        .strategy-desc {
             font-size: 12px;
             line-height: 1.4;
             color: #aaa;
             margin-bottom: 6px;
-        }}
+        }
         
-        .strategy-link {{
+        .strategy-link {
             display: inline-flex;
             align-items: center;
             gap: 4px;
@@ -484,24 +663,24 @@ class SignalRenderer:
             text-decoration: none;
             font-size: 11px;
             font-weight: 500;
-        }}
+        }
         
         /* Signal Footer */
-        .signal-footer {{
+        .signal-footer {
             display: flex;
             justify-content: space-between;
             align-items: center;
             font-size: 11px;
             color: #666;
-        }}
+        }
         
-        .notify-toggle {{
+        .notify-toggle {
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
+        }
         
-        .toggle {{
+        .toggle {
             width: 36px;
             height: 20px;
             background: #333;
@@ -509,13 +688,13 @@ class SignalRenderer:
             position: relative;
             cursor: pointer;
             transition: background 0.3s;
-        }}
+        }
         
-        .toggle.on {{
+        .toggle.on {
             background: #00ff88;
-        }}
+        }
         
-        .toggle-knob {{
+        .toggle-knob {
             width: 16px;
             height: 16px;
             background: white;
@@ -524,80 +703,323 @@ class SignalRenderer:
             top: 2px;
             left: 2px;
             transition: transform 0.3s;
-        }}
+        }
         
-        .toggle.on .toggle-knob {{
+        .toggle.on .toggle-knob {
             transform: translateX(16px);
-        }}
+        }
         
         /* Haptic Feedback */
-        .haptic {{
+        .haptic {
             cursor: pointer;
             -webkit-tap-highlight-color: transparent;
-        }}
+        }
         
         /* Mobile Optimizations */
-        @media (max-width: 375px) {{
-            .signal-card {{
+        @media (max-width: 375px) {
+            .signal-card {
                 padding: 12px;
-            }}
+            }
             
-            .ticker {{
+            .ticker {
                 font-size: 18px;
-            }}
+            }
             
-            .price {{
+            .price {
                 font-size: 22px;
-            }}
+            }
             
-            .key-stats {{
+            .key-stats {
                 gap: 6px;
-            }}
+            }
             
-            .stat {{
+            .stat {
                 padding: 6px 4px;
-            }}
+            }
             
-            .stat-value {{
+            .stat-value {
                 font-size: 14px;
-            }}
-        }}
+            }
+        }
         
         /* Watch Mode */
-        @media (max-width: 200px) {{
-            body {{
+        @media (max-width: 200px) {
+            body {
                 padding: 8px;
-            }}
+            }
             
-            .signal-card {{
+            .signal-card {
                 padding: 10px;
-            }}
+            }
             
-            .ticker {{
+            .ticker {
                 font-size: 16px;
-            }}
+            }
             
-            .price {{
+            .price {
                 font-size: 18px;
-            }}
+            }
             
-            .chart-section {{
+            .chart-section {
                 height: 50px;
-            }}
+            }
             
-            .key-stats {{
+            .key-stats {
                 display: none;
-            }}
+            }
             
-            .strategy-info {{
+            .strategy-info {
                 font-size: 10px;
                 padding: 8px;
-            }}
+            }
             
-            .strategy-desc {{
+            .strategy-desc {
                 display: none;
-            }}
-        }}"""
+            }
+        }"""
+
+# Optional CSS blocks for YOLO glow and dashed pre-market cards
+_YOLO_CSS = """
+        .signal-card.yolo {
+            background: linear-gradient(135deg, #1a1a1a 0%, #2d0d2d 100%);
+            border-color: #ff00ff;
+            animation: yolo-glow 3s ease-in-out infinite;
+        }
+        
+        @keyframes yolo-glow {
+            0%, 100% { box-shadow: 0 0 10px rgba(255, 0, 255, 0.3); }
+            50% { box-shadow: 0 0 20px rgba(255, 0, 255, 0.5); }
+        }"""
+
+_PRE_MARKET_CSS = """
+        .signal-card.pre-market {
+            border-style: dashed;
+            border-color: #ffd93d;
+        }"""
+
+# Page CSS depends only on (signal type, YOLO glow, dashed border), so each
+# variant is built on first use and reused afterwards
+@functools.lru_cache(maxsize=None)
+def _build_css(signal_type: SignalType, is_yolo: bool, dashed: bool) -> str:
+    """Build the page CSS for one signal style variant"""
+    primary_color = signal_type.value[2]
+    card_bg_style = signal_type.card_bg_style
+    yolo_styles = _YOLO_CSS if is_yolo else ""
+    pre_market_styles = _PRE_MARKET_CSS if dashed else ""
+    
+    return "".join((
+        _CSS_BASE, card_bg_style,
+        _CSS_CARD_BORDER, primary_color,
+        _CSS_VARIANT_SEP, yolo_styles,
+        _CSS_VARIANT_GAP, pre_market_styles,
+        _CSS_RESPONSIVE,
+    ))
+
+# Index page written by SignalRenderer.render_batch, one row per rendered signal
+_SUMMARY_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>SignalPro - {count} Signals</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: #000000;
+            color: #ffffff;
+            padding: 10px;
+            max-width: 420px;
+            margin: 0 auto;
+            -webkit-font-smoothing: antialiased;
+        }}
+        
+        .logo {{
+            font-size: 22px;
+            font-weight: bold;
+            padding: 15px 5px;
+            color: #00ff88;
+        }}
+        
+        .signal-row {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 12px 15px;
+            margin-bottom: 8px;
+            border-radius: 12px;
+            border-left: 3px solid;
+            background: #1a1a1a;
+            color: inherit;
+            text-decoration: none;
+        }}
+        
+        .ticker {{ font-weight: bold; }}
+        .company-name, .signal-type {{ font-size: 12px; color: #888; }}
+        .price {{ text-align: right; font-weight: 600; }}
+        .positive {{ color: #00ff88; }}
+        .negative {{ color: #ff4757; }}
+    </style>
+</head>
+<body>
+    <div class="logo">SignalPro</div>
+{rows}</body>
+</html>"""
+
+_SUMMARY_ROW = """    <a class="signal-row" href="{href}" style="border-left-color: {color};">
+        <div>
+            <div class="ticker">{ticker}</div>
+            <div class="company-name">{company_name}</div>
+        </div>
+        <div class="price">
+            <div>${price:,.2f}</div>
+            <div class="signal-type">{badge_text} <span class="{change_class}">{change_sign}{change_percent:.1f}%</span></div>
+        </div>
+    </a>
+"""
+
+class SignalRenderer:
+    """Universal rendering engine for trading signals"""
+    
+    def __init__(self, output_dir: str = "signals"):
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        # output_dir with a trailing separator, so output paths are one concat
+        self._prefix = os.path.join(output_dir, "")
+        
+    def render_signal(self, signal: SignalData, filename: str = None) -> str:
+        """
+        Render a signal to HTML
+        
+        Args:
+            signal: SignalData object with all required information
+            filename: Optional output filename (defaults to ticker_signal.html)
+            
+        Returns:
+            Path to generated HTML file
+        """
+        if not filename:
+            filename = f"{signal.ticker.lower()}_{signal.signal_type.slug}.html"
+            
+        # Stream the page through the file's own buffer instead of holding a
+        # second, encoded copy of it in memory
+        output_path = self._prefix + filename
+        with open(output_path, 'w', encoding='utf-8', newline='', buffering=65536) as f:
+            self._write_html(signal, f.write)
+            
+        return output_path
+    
+    def render_signals(self, signals: Sequence[SignalData], fsync: bool = False) -> List[str]:
+        """
+        Render a batch of signals to HTML
+        
+        Args:
+            signals: SignalData objects, each written to its default filename
+            fsync: Flush the written files to disk once the whole batch is out
+            
+        Returns:
+            Paths to the generated HTML files, in input order
+        """
+        paths = [self.render_signal(signal) for signal in signals]
+        
+        # Deferred until every file is written so the kernel can coalesce
+        # the batch's writeback instead of stalling after each page
+        if fsync:
+            for path in paths:
+                fd = os.open(path, os.O_RDWR)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                    
+        return paths
+    
+    def render_batch(self, signals: Sequence[SignalData], summary_filename: str = "summary.html") -> List[str]:
+        """
+        Render a batch of signals plus a summary page linking to each of them
+        
+        Args:
+            signals: SignalData objects, each written to its default filename
+            summary_filename: Filename of the summary page inside output_dir
+            
+        Returns:
+            Paths to the generated HTML files in input order, followed by
+            the summary page
+        """
+        paths = self.render_signals(signals)
+        
+        # Signal text is user-supplied, so every string in the summary is
+        # escaped; filenames are also percent-encoded for the links
+        rows = "".join(
+            _SUMMARY_ROW.format(
+                href=html.escape(urllib.parse.quote(os.path.basename(path))),
+                color=html.escape(signal.signal_type.value[2]),
+                ticker=html.escape(signal.ticker),
+                company_name=html.escape(signal.company_name),
+                price=signal.current_price,
+                badge_text=html.escape(signal.signal_type.name.replace('_', ' ')),
+                change_class='positive' if signal.price_change_percent > 0 else 'negative',
+                change_sign='+' if signal.price_change_percent > 0 else '',
+                change_percent=signal.price_change_percent,
+            )
+            for signal, path in zip(signals, paths)
+        )
+        
+        summary_path = self._prefix + summary_filename
+        with open(summary_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(_SUMMARY_TEMPLATE.format(count=len(paths), rows=rows))
+            
+        paths.append(summary_path)
+        return paths
+    
+    def _generate_html(self, signal: SignalData) -> str:
+        """Generate complete HTML for a signal"""
+        # Collect the page pieces as-is and copy them together exactly once
+        parts: List[str] = []
+        self._write_html(signal, parts.append)
+        return "".join(parts)
+    
+    def _write_html(self, signal: SignalData, write) -> None:
+        """Write complete HTML for a signal through a write(str) callable"""
+        fields = self._page_fields(signal)
+        for literal, name, spec in _PAGE_RUNS:
+            write(literal)
+            if name is not None:
+                write(format(fields[name], spec))
+    
+    def _page_fields(self, signal: SignalData) -> Dict[str, object]:
+        """Collect the values substituted into the page template"""
+        
+        # Get style configuration
+        badge_class, card_bg, chart_color = signal.signal_type.value
+        
+        # Generate chart JavaScript
+        chart_js = self._generate_chart_js(signal, chart_color)
+        
+        return dict(
+            title=signal.strategy.title if signal.strategy else signal.signal_type.name,
+            css=self._get_css(signal),
+            card_classes=_CARD_CLASSES[bool(signal.is_yolo), signal.border_style == "dashed"],
+            priority_label=self._get_priority_label(signal),
+            ticker=signal.ticker,
+            badge_class=badge_class,
+            badge_text=signal.signal_type.name.replace('_', ' '),
+            company_name=signal.company_name,
+            price=signal.current_price,
+            change_class='positive' if signal.price_change_percent > 0 else 'negative',
+            change_sign='+' if signal.price_change_percent > 0 else '',
+            change_percent=signal.price_change_percent,
+            chart_section=self._get_chart_section(signal),
+            key_stats=self._get_key_stats(signal),
+            strategy_section=self._get_strategy_section(signal),
+            toggle_class='on' if signal.notifications_enabled else '',
+            timestamp=signal.timestamp,
+            chart_js=chart_js,
+            javascript=self._get_javascript(),
+        )
+    
+    def _get_css(self, signal: SignalData) -> str:
+        """Generate CSS styles based on signal type"""
+        return _build_css(signal.signal_type, bool(signal.is_yolo), signal.border_style == "dashed")
     
     def _get_priority_label(self, signal: SignalData) -> str:
         """Generate priority label HTML if needed"""
@@ -621,17 +1043,17 @@ class SignalRenderer:
         if not signal.key_stats:
             return ""
             
-        stats_html = ""
-        for stat in signal.key_stats[:3]:  # Limit to 3 for mobile layout
-            color_class = "positive" if stat.is_positive else "negative" if not stat.is_positive and stat.value.startswith('-') else ""
-            stats_html += f"""            <div class="stat">
-                <div class="stat-value {color_class}">{stat.value}</div>
+        parts = ['        <div class="key-stats">\n']
+        parts.extend(
+            f"""            <div class="stat">
+                <div class="stat-value {_stat_color_class(stat)}">{stat.value}</div>
                 <div class="stat-label">{stat.label}</div>
             </div>
 """
-        
-        return f"""        <div class="key-stats">
-{stats_html}        </div>"""
+            for stat in signal.key_stats[:3]  # Limit to 3 for mobile layout
+        )
+        parts.append("        </div>")
+        return "".join(parts)
     
     def _get_strategy_section(self, signal: SignalData) -> str:
         """Generate strategy information HTML"""
@@ -653,146 +1075,102 @@ class SignalRenderer:
         if not signal.chart_data:
             return ""
             
-        ticker_lower = signal.ticker.lower()
-        
-        # Convert data to JavaScript arrays
-        historical = json.dumps(signal.chart_data.historical_data)
-        upper = json.dumps(signal.chart_data.prediction_upper)
-        base = json.dumps(signal.chart_data.prediction_base)
-        lower = json.dumps(signal.chart_data.prediction_lower)
-        
-        return f"""        // Mini chart configuration
-        const miniChartOptions = {{
-            responsive: true,
-            maintainAspectRatio: false,
-            plugins: {{
-                legend: {{ display: false }},
-                tooltip: {{ enabled: false }}
-            }},
-            scales: {{
-                x: {{ 
-                    display: false,
-                    grid: {{ display: false }}
-                }},
-                y: {{ 
-                    display: false,
-                    grid: {{ display: false }}
-                }}
-            }},
-            elements: {{
-                point: {{ radius: 0 }},
-                line: {{ borderWidth: 2 }}
-            }},
-            interaction: {{
-                intersect: false
-            }}
-        }};
-        
-        // Initialize chart with prediction bands
-        const chartCtx = document.getElementById('chart-{ticker_lower}')?.getContext('2d');
-        if (chartCtx) {{
-            const currentPrice = {signal.current_price};
-            new Chart(chartCtx, {{
-                type: 'line',
-                data: {{
-                    labels: Array.from({{length: 40}}, (_, i) => i - 20),
-                    datasets: [
-                        {{
-                            label: 'Historical',
-                            data: {historical}.concat(Array(20).fill(null)),
-                            borderColor: '{chart_color}',
-                            backgroundColor: 'transparent',
-                            borderWidth: 2,
-                            pointRadius: 0,
-                            tension: 0.3
-                        }},
-                        {{
-                            label: 'Upper Band',
-                            data: Array(20).fill(null).concat({upper}),
-                            borderColor: 'rgba(255, 71, 87, 0.3)',
-                            borderDash: [5, 5],
-                            borderWidth: 1,
-                            pointRadius: 0,
-                            fill: '+1',
-                            backgroundColor: 'rgba(255, 71, 87, 0.1)'
-                        }},
-                        {{
-                            label: 'Base Case',
-                            data: Array(20).fill(null).concat({base}),
-                            borderColor: '{chart_color}',
-                            borderDash: [5, 5],
-                            borderWidth: 2,
-                            pointRadius: 0
-                        }},
-                        {{
-                            label: 'Lower Band',
-                            data: Array(20).fill(null).concat({lower}),
-                            borderColor: 'rgba(255, 71, 87, 0.3)',
-                            borderDash: [5, 5],
-                            borderWidth: 1,
-                            pointRadius: 0,
-                            fill: false
-                        }}
-                    ]
-                }},
-                options: miniChartOptions
-            }});
-        }}"""
+        chart_data = signal.chart_data
+        if chart_data._bands_price is not None:
+            # Standard bands - ship the price and let the page project them
+            bands = _PREDICTION_BANDS_JS % (float(chart_data._bands_price), CHART_POINTS, CHART_POINTS)
+            upper, base, lower = "bands.upper", "bands.base", "bands.lower"
+        else:
+            # Convert data to JavaScript arrays
+            bands = ""
+            upper = _floats_to_js_array(chart_data.prediction_upper)
+            base = _floats_to_js_array(chart_data.prediction_base)
+            lower = _floats_to_js_array(chart_data.prediction_lower)
+            
+        return _CHART_JS_TEMPLATE % {
+            "ticker": signal.ticker.lower(),
+            "current_price": signal.current_price,
+            "chart_color": chart_color,
+            "historical": _floats_to_js_array(chart_data.historical_data),
+            "bands": bands,
+            "upper": upper,
+            "base": base,
+            "lower": lower,
+        }
     
     def _get_javascript(self) -> str:
         """Generate common JavaScript functions"""
-        return """        
-        // Toggle notification
-        function toggleNotify(element) {
-            element.classList.toggle('on');
-            vibrate();
-        }
-        
-        // Haptic feedback
-        function vibrate(duration = 10) {
-            if ('vibrate' in navigator) {
-                navigator.vibrate(duration);
-            }
-        }
-        
-        // Real-time price updates
-        function updatePrice() {
-            const priceEl = document.querySelector('.price');
-            const changeEl = document.querySelector('.change');
-            if (priceEl) {
-                const current = parseFloat(priceEl.textContent.replace('$', '').replace(',', ''));
-                const change = (Math.random() - 0.5) * 0.02 * current;
-                const newPrice = current + change;
-                
-                if (current > 1000) {
-                    priceEl.textContent = '$' + newPrice.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
-                } else {
-                    priceEl.textContent = '$' + newPrice.toFixed(2);
-                }
-                
-                if (changeEl) {
-                    const percent = ((Math.random() - 0.4) * 5).toFixed(1);
-                    changeEl.textContent = (percent > 0 ? '+' : '') + percent + '%';
-                    changeEl.className = 'change ' + (percent > 0 ? 'positive' : 'negative');
-                }
-            }
-        }
-        
-        // Initialize
-        document.addEventListener('DOMContentLoaded', () => {
-            // Start price updates
-            setInterval(updatePrice, 5000);
-            
-            // Add haptic to all interactive elements
-            document.querySelectorAll('.haptic').forEach(el => {
-                el.addEventListener('click', () => vibrate());
-            });
-        });
-        
-        // PWA Support
-        if ('serviceWorker' in navigator) {
-            navigator.serviceWorker.register('/sw.js').catch(() => {});
-        }"""
+        return _PAGE_JS
+
+# Number of points in each chart series (historical and prediction)
+CHART_POINTS = 20
+
+# Prediction band terms depend only on the point index, so compute them once:
+# (progress, upper band curvature, lower band curvature) per point
+_BAND_TERMS = tuple(
+    (i / CHART_POINTS, math.pow(i, 1.1), math.pow(i, 1.05))
+    for i in range(CHART_POINTS)
+)
+
+# Swing shape of the volatile pattern, also index-only
+_VOLATILE_WAVE = tuple(math.sin(i * 0.5) for i in range(CHART_POINTS))
+
+def _momentum_history(current_price: float) -> List[float]:
+    """Strong upward trend"""
+    uniform = random.uniform
+    base = current_price * 0.8
+    return [
+        base + (current_price - base) * (i / 15) + uniform(-2, 2) if i < 15
+        else current_price + uniform(-3, 3)
+        for i in range(CHART_POINTS)
+    ]
+
+def _volatile_history(current_price: float) -> List[float]:
+    """High volatility swings"""
+    uniform = random.uniform
+    return [
+        current_price + wave * current_price * 0.1 + uniform(-5, 5)
+        for wave in _VOLATILE_WAVE
+    ]
+
+def _breakout_history(current_price: float) -> List[float]:
+    """Consolidation then breakout"""
+    uniform = random.uniform
+    floor = current_price * 0.9
+    return [
+        floor + uniform(-2, 2) if i < 15
+        else floor + (current_price - floor) * ((i - 15) / 5)
+        for i in range(CHART_POINTS)
+    ]
+
+def _decline_history(current_price: float) -> List[float]:
+    """Downward trend"""
+    uniform = random.uniform
+    base = current_price * 1.2
+    return [
+        base - (base - current_price) * (i / CHART_POINTS) + uniform(-2, 2)
+        for i in range(CHART_POINTS)
+    ]
+
+def _prediction_bands(current_price: float) -> Tuple[List[float], List[float], List[float]]:
+    """Standard (upper, base, lower) prediction bands projected from a price"""
+    # Upper band (bullish scenario)
+    prediction_upper = [current_price + current_price * 0.3 * progress + upper for progress, upper, _ in _BAND_TERMS]
+    
+    # Base case (moderate growth)
+    prediction_base = [current_price + current_price * 0.1 * progress for progress, _, _ in _BAND_TERMS]
+    
+    # Lower band (bearish scenario)
+    prediction_lower = [current_price - current_price * 0.2 * progress - lower for progress, _, lower in _BAND_TERMS]
+    
+    return prediction_upper, prediction_base, prediction_lower
+
+_HISTORY_PATTERNS = {
+    "momentum": _momentum_history,
+    "volatile": _volatile_history,
+    "breakout": _breakout_history,
+    "decline": _decline_history,
+}
 
 def generate_chart_data(ticker: str, current_price: float, pattern: str = "momentum") -> ChartData:
     """
@@ -802,60 +1180,15 @@ def generate_chart_data(ticker: str, current_price: float, pattern: str = "momen
     - momentum: Strong upward trend
     - volatile: High volatility swings
     - breakout: Consolidation then breakout
-    - decline: Downward trend
+    - decline: Downward trend (also used for unknown patterns)
     """
-    import math
-    import random
-    
     # Generate historical data based on pattern
-    historical = []
-    
-    if pattern == "momentum":
-        # Strong upward trend
-        base = current_price * 0.8
-        for i in range(20):
-            if i < 15:
-                historical.append(base + (current_price - base) * (i / 15) + random.uniform(-2, 2))
-            else:
-                historical.append(current_price + random.uniform(-3, 3))
-                
-    elif pattern == "volatile":
-        # High volatility
-        for i in range(20):
-            historical.append(current_price + math.sin(i * 0.5) * current_price * 0.1 + random.uniform(-5, 5))
-            
-    elif pattern == "breakout":
-        # Consolidation then breakout
-        for i in range(20):
-            if i < 15:
-                historical.append(current_price * 0.9 + random.uniform(-2, 2))
-            else:
-                historical.append(current_price * 0.9 + (current_price - current_price * 0.9) * ((i - 15) / 5))
-                
-    else:  # decline
-        # Downward trend
-        base = current_price * 1.2
-        for i in range(20):
-            historical.append(base - (base - current_price) * (i / 20) + random.uniform(-2, 2))
+    historical = _HISTORY_PATTERNS.get(pattern, _decline_history)(current_price)
     
     # Generate prediction bands
-    prediction_upper = []
-    prediction_base = []
-    prediction_lower = []
-    
-    for i in range(20):
-        progress = i / 20
-        
-        # Upper band (bullish scenario)
-        prediction_upper.append(current_price + current_price * 0.3 * progress + math.pow(i, 1.1))
-        
-        # Base case (moderate growth)
-        prediction_base.append(current_price + current_price * 0.1 * progress)
-        
-        # Lower band (bearish scenario)
-        prediction_lower.append(current_price - current_price * 0.2 * progress - math.pow(i, 1.05))
+    prediction_upper, prediction_base, prediction_lower = _prediction_bands(current_price)
     
-    return ChartData(
+    chart_data = ChartData(
         historical_data=historical,
         prediction_upper=prediction_upper,
         prediction_base=prediction_base,
@@ -863,6 +1196,8 @@ def generate_chart_data(ticker: str, current_price: float, pattern: str = "momen
         event_label=f"Signal @ ${current_price:.2f}",
         chart_color="#00ff88"
     )
+    chart_data._bands_price = current_price
+    return chart_data
 
 def demo_signal_renderer():
     """Demo function to show signal renderer in action"""
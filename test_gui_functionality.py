@@ -7,7 +7,10 @@ from signal_renderer import (
     SignalRenderer, SignalData, SignalType, SignalPriority, 
     ChartData, KeyStat, StrategyInfo, generate_chart_data
 )
+import functools
+import io
 import os
+import sys
 
 def test_gui_data_flow():
     """Test the same data flow the GUI uses"""
@@ -91,8 +94,12 @@ def test_gui_data_flow():
         filename = "TSLA_earnings_gui_test.html"
         output_path = renderer.render_signal(signal_data, filename)
         
-        if os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
+        try:
+            file_size = os.stat(output_path).st_size
+        except FileNotFoundError:
+            file_size = None
+            
+        if file_size is not None:
             print(f"✅ HTML generated: {output_path}")
             print(f"📁 File size: {file_size:,} bytes")
             print(f"🌐 Browser: file://{os.path.abspath(output_path)}")
@@ -107,33 +114,38 @@ def test_gui_data_flow():
         traceback.print_exc()
         return False
 
+# Sample gallery signals, one per showcased style
+_GUI_SAMPLES = (
+    {
+        'ticker': 'NVDA', 'company_name': 'Nvidia Corporation', 'signal_type': 'PRE_MARKET',
+        'price': 1125.50, 'change_pct': 5.2, 'priority': 'NORMAL', 'pattern': 'breakout',
+        'title': 'Pre-Market Gap & Go', 'border': 'dashed'
+    },
+    {
+        'ticker': 'BTC', 'company_name': 'Bitcoin Moonshot', 'signal_type': 'YOLO_CALLS',
+        'price': 105456.00, 'change_pct': 3.8, 'priority': 'NORMAL', 'pattern': 'momentum',
+        'title': 'Dec 150K Call Options', 'border': 'solid', 'yolo': True
+    },
+    {
+        'ticker': 'SAVA', 'company_name': 'Cassava Sciences', 'signal_type': 'FDA_EVENT',
+        'price': 42.15, 'change_pct': 12.3, 'priority': 'URGENT', 'pattern': 'volatile',
+        'title': 'Binary FDA Event - YOLO!', 'border': 'solid', 'yolo': True
+    }
+)
+
 def create_sample_signals():
     """Create multiple sample signals to demonstrate GUI capabilities"""
-    print("\n🎨 Creating Sample Signal Gallery")
-    print("=" * 50)
+    # Collect the gallery report in memory and emit it with a single write
+    report = io.StringIO()
+    log = functools.partial(print, file=report)
     
-    samples = [
-        {
-            'ticker': 'NVDA', 'company_name': 'Nvidia Corporation', 'signal_type': 'PRE_MARKET',
-            'price': 1125.50, 'change_pct': 5.2, 'priority': 'NORMAL', 'pattern': 'breakout',
-            'title': 'Pre-Market Gap & Go', 'border': 'dashed'
-        },
-        {
-            'ticker': 'BTC', 'company_name': 'Bitcoin Moonshot', 'signal_type': 'YOLO_CALLS',
-            'price': 105456.00, 'change_pct': 3.8, 'priority': 'NORMAL', 'pattern': 'momentum',
-            'title': 'Dec 150K Call Options', 'border': 'solid', 'yolo': True
-        },
-        {
-            'ticker': 'SAVA', 'company_name': 'Cassava Sciences', 'signal_type': 'FDA_EVENT',
-            'price': 42.15, 'change_pct': 12.3, 'priority': 'URGENT', 'pattern': 'volatile',
-            'title': 'Binary FDA Event - YOLO!', 'border': 'solid', 'yolo': True
-        }
-    ]
+    log("\n🎨 Creating Sample Signal Gallery")
+    log("=" * 50)
     
     renderer = SignalRenderer(output_dir="gui_sample_gallery")
     generated = []
     
-    for i, sample in enumerate(samples, 1):
+    for i, sample in enumerate(_GUI_SAMPLES, 1):
         try:
             # Quick signal creation
             signal_data = SignalData(
@@ -152,17 +164,22 @@ def create_sample_signals():
             filename = f"{sample['ticker']}_{sample['signal_type'].lower()}_sample.html"
             output_path = renderer.render_signal(signal_data, filename)
             
-            if os.path.exists(output_path):
-                size = os.path.getsize(output_path)
-                print(f"[{i}/3] ✅ {sample['ticker']} ({sample['signal_type']}) - {size:,} bytes")
+            try:
+                size = os.stat(output_path).st_size
+            except FileNotFoundError:
+                size = None
+                
+            if size is not None:
+                log(f"[{i}/3] ✅ {sample['ticker']} ({sample['signal_type']}) - {size:,} bytes")
                 generated.append(output_path)
             else:
-                print(f"[{i}/3] ❌ {sample['ticker']} - generation failed")
+                log(f"[{i}/3] ❌ {sample['ticker']} - generation failed")
                 
         except Exception as e:
-            print(f"[{i}/3] ❌ {sample['ticker']} - error: {e}")
+            log(f"[{i}/3] ❌ {sample['ticker']} - error: {e}")
     
-    print(f"\n🎉 Generated {len(generated)}/3 sample signals")
+    log(f"\n🎉 Generated {len(generated)}/3 sample signals")
+    sys.stdout.write(report.getvalue())
     return generated
 
 if __name__ == "__main__":
@@ -3,13 +3,48 @@
 Direct test of signal_renderer.py to validate functionality
 """
 
+import contextlib
+import functools
+import io
+import json
+import math
 import os
+import re
+import shutil
+import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from signal_renderer import (
     SignalRenderer, SignalData, SignalType, SignalPriority, 
     ChartData, KeyStat, StrategyInfo, generate_chart_data
 )
+from signal_renderer import _prediction_bands
 
+def _file_size(path):
+    """Size of a file in bytes, or None if it does not exist (one stat call)"""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+def _buffered_output(test):
+    """Collect a test's progress lines and write them out in one go"""
+    @functools.wraps(test)
+    def run():
+        report = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(report):
+                return test()
+        finally:
+            sys.stdout.write(report.getvalue())
+    return run
+
+@functools.lru_cache(maxsize=None)
+def _get_renderer(output_dir):
+    """Shared renderer per output directory"""
+    return SignalRenderer(output_dir=output_dir)
+
+@_buffered_output
 def test_basic_signal():
     """Test rendering a basic signal"""
     print("🧪 Testing basic signal rendering...")
@@ -27,7 +62,7 @@ def test_basic_signal():
     print(f"   📊 Created signal: {signal.ticker} - {signal.company_name}")
     
     # Initialize renderer
-    renderer = SignalRenderer(output_dir="test_output")
+    renderer = _get_renderer("test_output")
     print(f"   🎨 Renderer initialized, output dir: test_output")
     
     # Render signal
@@ -36,8 +71,8 @@ def test_basic_signal():
         print(f"   ✅ Signal rendered to: {output_path}")
         
         # Check if file exists and has content
-        if os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
+        file_size = _file_size(output_path)
+        if file_size is not None:
             print(f"   📁 File size: {file_size} bytes")
             
             if file_size > 1000:  # Should be at least 1KB for valid HTML
@@ -56,6 +91,7 @@ def test_basic_signal():
         traceback.print_exc()
         return False
 
+@_buffered_output
 def test_full_featured_signal():
     """Test rendering a signal with all features"""
     print("\n🧪 Testing full-featured signal...")
@@ -97,20 +133,23 @@ def test_full_featured_signal():
     print(f"   📊 Chart data: {len(signal.chart_data.historical_data)} historical points")
     
     # Render signal
-    renderer = SignalRenderer(output_dir="test_output")
+    renderer = _get_renderer("test_output")
     
     try:
         output_path = renderer.render_signal(signal, "test_full.html")
         print(f"   ✅ Full signal rendered to: {output_path}")
         
         # Validate file
-        if os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
+        file_size = _file_size(output_path)
+        if file_size is not None:
             print(f"   📁 File size: {file_size} bytes")
             
-            # Read first few lines to validate HTML structure
+            # Read the page once for both the preview and the element checks
             with open(output_path, 'r') as f:
-                first_lines = [f.readline().strip() for _ in range(5)]
+                content = f.read()
+                
+            # First few lines to validate HTML structure
+            first_lines = [line.strip() for line in content.split('\n', 5)[:5]]
                 
             print("   📄 File starts with:")
             for i, line in enumerate(first_lines, 1):
@@ -118,9 +157,6 @@ def test_full_featured_signal():
                     print(f"      {i}: {line[:80]}...")
                     
             # Check for key elements
-            with open(output_path, 'r') as f:
-                content = f.read()
-                
             key_elements = [
                 ('DOCTYPE', '<!DOCTYPE html>' in content),
                 ('Title', '<title>' in content),
@@ -151,51 +187,239 @@ def test_full_featured_signal():
         traceback.print_exc()
         return False
 
+# One test signal per type: (ticker, company, type, price, change %)
+_RENDERER_SIGNALS = (
+    ("CRCL", "Circle Group", SignalType.IPO_TODAY, 69.00, 122.6),
+    ("BTC", "Bitcoin", SignalType.YOLO_CALLS, 105456.00, 3.8),
+    ("NVDA", "Nvidia", SignalType.PRE_MARKET, 1125.50, 5.2),
+    ("AMZN", "Amazon", SignalType.STOCK_SPLIT, 3245.00, 8.2),
+    ("TSLA", "Tesla", SignalType.PUT_SPREAD, 245.80, -1.2),
+    ("ETH", "Ethereum", SignalType.CRYPTO_DEFI, 3856.00, 4.5),
+    ("SAVA", "Cassava Sciences", SignalType.FDA_EVENT, 42.15, 12.3),
+    ("GOOGL", "Google", SignalType.EARNINGS, 178.25, 8.5),
+    ("AMD", "AMD", SignalType.UNUSUAL_OPTIONS, 185.40, 2.1),
+    ("GME", "GameStop", SignalType.MEME_SQUEEZE, 45.20, 35.2)
+)
+
+def _render_one(args):
+    """Render one test signal (runs inside a worker process)"""
+    ticker, company, signal_type, price, change_pct = args
+    try:
+        signal = SignalData(
+            ticker=ticker,
+            company_name=company,
+            signal_type=signal_type,
+            current_price=price,
+            price_change=price * (change_pct / 100),
+            price_change_percent=change_pct
+        )
+        
+        filename = f"test_{ticker.lower()}_{signal_type.name.lower()}.html"
+        output_path = _get_renderer("test_output").render_signal(signal, filename)
+        
+        if (_file_size(output_path) or 0) > 1000:
+            return ticker, signal_type.name, None
+        return ticker, signal_type.name, "file too small or missing"
+        
+    except Exception as e:
+        return ticker, signal_type.name, f"error: {e}"
+
 def test_all_signal_types():
     """Test rendering all signal types"""
     print("\n🧪 Testing all signal types...")
     
-    test_signals = [
-        ("CRCL", "Circle Group", SignalType.IPO_TODAY, 69.00, 122.6),
-        ("BTC", "Bitcoin", SignalType.YOLO_CALLS, 105456.00, 3.8),
-        ("NVDA", "Nvidia", SignalType.PRE_MARKET, 1125.50, 5.2),
-        ("AMZN", "Amazon", SignalType.STOCK_SPLIT, 3245.00, 8.2),
-        ("TSLA", "Tesla", SignalType.PUT_SPREAD, 245.80, -1.2),
-        ("ETH", "Ethereum", SignalType.CRYPTO_DEFI, 3856.00, 4.5),
-        ("SAVA", "Cassava Sciences", SignalType.FDA_EVENT, 42.15, 12.3),
-        ("GOOGL", "Google", SignalType.EARNINGS, 178.25, 8.5),
-        ("AMD", "AMD", SignalType.UNUSUAL_OPTIONS, 185.40, 2.1),
-        ("GME", "GameStop", SignalType.MEME_SQUEEZE, 45.20, 35.2)
-    ]
+    # Each signal renders to its own file, so spread them over worker processes
+    workers = min(len(_RENDERER_SIGNALS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_render_one, args) for args in _RENDERER_SIGNALS]
+        if os.environ.get("STOP_ON_FAIL"):
+            # Stop at the first failure, dropping renders that have not started
+            for future in as_completed(futures):
+                if future.result()[2] is not None:
+                    executor.shutdown(cancel_futures=True)
+                    break
+    results = [future.result() for future in futures if not future.cancelled()]
     
-    renderer = SignalRenderer(output_dir="test_output")
     success_count = 0
+    for ticker, type_name, error in results:
+        if error is None:
+            print(f"   ✅ {ticker} ({type_name})")
+            success_count += 1
+        else:
+            print(f"   ❌ {ticker} ({type_name}) - {error}")
     
-    for ticker, company, signal_type, price, change_pct in test_signals:
-        try:
-            signal = SignalData(
-                ticker=ticker,
-                company_name=company,
-                signal_type=signal_type,
-                current_price=price,
-                price_change=price * (change_pct / 100),
-                price_change_percent=change_pct
-            )
-            
-            filename = f"test_{ticker.lower()}_{signal_type.name.lower()}.html"
-            output_path = renderer.render_signal(signal, filename)
-            
-            if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
-                print(f"   ✅ {ticker} ({signal_type.name})")
-                success_count += 1
-            else:
-                print(f"   ❌ {ticker} ({signal_type.name}) - file too small or missing")
-                
-        except Exception as e:
-            print(f"   ❌ {ticker} ({signal_type.name}) - error: {e}")
+    print(f"\n   📊 Success rate: {success_count}/{len(_RENDERER_SIGNALS)} ({success_count/len(_RENDERER_SIGNALS)*100:.1f}%)")
+    return success_count == len(_RENDERER_SIGNALS)
+
+def test_signal_to_dict():
+    """Test the explicit dict export of a signal"""
+    print("\n🧪 Testing signal to_dict...")
+    
+    signal = SignalData(
+        ticker="PLTR",
+        company_name="Palantir",
+        signal_type=SignalType.YOLO_CALLS,
+        current_price=24.80,
+        price_change=1.10,
+        price_change_percent=4.6,
+        priority=SignalPriority.URGENT,
+        key_stats=[KeyStat("$30", "Target", True)],
+        strategy=StrategyInfo(title="Gov Contract Momentum", description="New DoD award."),
+        chart_data=generate_chart_data("PLTR", 24.80, "volatile")
+    )
+    
+    try:
+        data = signal.to_dict()
+        json.dumps(data)
+    except Exception as e:
+        print(f"   ❌ to_dict error: {e}")
+        return False
+    
+    checks = [
+        data["signal_type"] == "YOLO_CALLS",
+        data["priority"] == "URGENT",
+        data["key_stats"] == [{"value": "$30", "label": "Target", "is_positive": True}],
+        data["strategy"]["title"] == "Gov Contract Momentum",
+        data["chart_data"]["historical_data"] == signal.chart_data.historical_data,
+        data["chart_data"]["historical_data"] is not signal.chart_data.historical_data,
+    ]
+    if not all(checks):
+        print(f"   ❌ Unexpected dict: {data}")
+        return False
+    
+    print(f"   ✅ {len(data)} fields exported")
+    return True
+
+def test_batch_render():
+    """Test rendering a batch of signals"""
+    print("\n🧪 Testing batch rendering...")
+    
+    signals = [
+        SignalData(
+            ticker=ticker,
+            company_name=company,
+            signal_type=signal_type,
+            current_price=price,
+            price_change=price * (change_pct / 100),
+            price_change_percent=change_pct
+        )
+        for ticker, company, signal_type, price, change_pct in [
+            ("MSFT", "Microsoft", SignalType.EARNINGS, 415.20, 2.4),
+            ("MRNA", "Moderna", SignalType.FDA_EVENT, 98.10, -3.5),
+            ("SOL", "Solana", SignalType.CRYPTO_DEFI, 172.40, 6.1)
+        ]
+    ]
+    
+    renderer = _get_renderer("test_output")
+    
+    try:
+        paths = renderer.render_signals(signals, fsync=True)
+    except Exception as e:
+        print(f"   ❌ Batch render error: {e}")
+        return False
+    
+    expected = [os.path.join("test_output", f"{s.ticker.lower()}_{s.signal_type.name.lower()}.html") for s in signals]
+    if paths != expected:
+        print(f"   ❌ Unexpected paths: {paths}")
+        return False
+    
+    for path in paths:
+        if not (_file_size(path) or 0) > 1000:
+            print(f"   ❌ {path} - file too small or missing")
+            return False
+        print(f"   ✅ {path}")
+    
+    return True
+
+def test_batch_summary():
+    """Test rendering a batch with its summary page"""
+    print("\n🧪 Testing batch summary page...")
+    
+    signals = [
+        SignalData(ticker="COIN", company_name="Coinbase", signal_type=SignalType.CRYPTO_DEFI,
+                   current_price=265.30, price_change=12.10, price_change_percent=4.8),
+        SignalData(ticker="NKE", company_name="Nike & <Co>", signal_type=SignalType.PUT_SPREAD,
+                   current_price=74.60, price_change=-2.20, price_change_percent=-2.9)
+    ]
+    
+    renderer = _get_renderer("test_output")
+    
+    try:
+        paths = renderer.render_batch(signals, "test_summary.html")
+    except Exception as e:
+        print(f"   ❌ Batch summary error: {e}")
+        return False
+    
+    summary_path = os.path.join("test_output", "test_summary.html")
+    if len(paths) != len(signals) + 1 or paths[-1] != summary_path:
+        print(f"   ❌ Unexpected paths: {paths}")
+        return False
+    
+    with open(summary_path, 'r') as f:
+        content = f.read()
+        
+    for path in paths[:-1]:
+        if f'href="{os.path.basename(path)}"' not in content:
+            print(f"   ❌ Summary missing link to {path}")
+            return False
+    
+    if "Nike &amp; &lt;Co&gt;" not in content:
+        print("   ❌ Company name not HTML-escaped in summary")
+        return False
+    
+    print(f"   ✅ {summary_path} links {len(signals)} signals")
+    return True
+
+def test_prediction_bands():
+    """Test browser-computed bands and caller-edited bands"""
+    print("\n🧪 Testing prediction bands...")
+    
+    renderer = _get_renderer("test_output")
+    price = 248.5
+    signal = SignalData(ticker="BAND", company_name="Band Test", signal_type=SignalType.EARNINGS,
+                        current_price=price, price_change=5.0, price_change_percent=2.1,
+                        chart_data=generate_chart_data("BAND", price))
+    
+    with open(renderer.render_signal(signal, "test_bands.html"), 'r') as f:
+        content = f.read()
+        
+    loop = re.search(r"const bands = .*?\n            }\n", content, re.S)
+    if not loop:
+        print("   ❌ Standard bands not computed in the page")
+        return False
+    
+    # Run the page's band loop and compare against the bands
+    # generate_chart_data computes (and pages used to embed)
+    node = shutil.which("node")
+    if node:
+        result = subprocess.run([node, "-e", loop.group(0) + "console.log(JSON.stringify(bands));"],
+                                capture_output=True, text=True, timeout=10)
+        if result.returncode != 0:
+            print(f"   ❌ node could not run the page's band loop: {result.stderr.strip()}")
+            return False
+        bands = json.loads(result.stdout)
+        for name, expected in zip(("upper", "base", "lower"), _prediction_bands(price)):
+            if len(bands[name]) != len(expected) or not all(
+                math.isclose(got, want, abs_tol=1e-9) for got, want in zip(bands[name], expected)
+            ):
+                print(f"   ❌ {name} band differs from _prediction_bands: {bands[name]}")
+                return False
+        print("   ✅ Page bands match _prediction_bands")
+    else:
+        print("   ⚠️ node not found - skipped evaluating the page's band loop")
+    
+    # A caller's replacement band must reach the page
+    signal.chart_data.prediction_upper = [value + 1.0 if i == 0 else value
+                                          for i, value in enumerate(signal.chart_data.prediction_upper)]
+    with open(renderer.render_signal(signal, "test_bands_edited.html"), 'r') as f:
+        content = f.read()
+        
+    if "const bands" in content or "concat([249.5," not in content:
+        print("   ❌ Edited upper band was not embedded")
+        return False
     
-    print(f"\n   📊 Success rate: {success_count}/{len(test_signals)} ({success_count/len(test_signals)*100:.1f}%)")
-    return success_count == len(test_signals)
+    print("   ✅ Edited bands embedded as given")
+    return True
 
 def main():
     """Run all tests"""
@@ -204,7 +428,6 @@ def main():
     
     # Clean up any previous test files
     if os.path.exists("test_output"):
-        import shutil
         shutil.rmtree("test_output")
     
     test_results = []
@@ -213,6 +436,10 @@ def main():
     test_results.append(("Basic Signal", test_basic_signal()))
     test_results.append(("Full Featured Signal", test_full_featured_signal()))  
     test_results.append(("All Signal Types", test_all_signal_types()))
+    test_results.append(("Signal to_dict", test_signal_to_dict()))
+    test_results.append(("Batch Render", test_batch_render()))
+    test_results.append(("Batch Summary", test_batch_summary()))
+    test_results.append(("Prediction Bands", test_prediction_bands()))
     
     # Summary
     print("\n" + "=" * 50)
@@ -229,13 +456,12 @@ def main():
     
     # List generated files
     if os.path.exists("test_output"):
-        files = os.listdir("test_output")
-        if files:
-            print(f"\n📁 Generated {len(files)} test files in test_output/:")
-            for file in sorted(files):
-                file_path = os.path.join("test_output", file)
-                size = os.path.getsize(file_path)
-                print(f"   📄 {file} ({size:,} bytes)")
+        with os.scandir("test_output") as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        if entries:
+            print(f"\n📁 Generated {len(entries)} test files in test_output/:")
+            for entry in entries:
+                print(f"   📄 {entry.name} ({entry.stat().st_size:,} bytes)")
         else:
             print("\n❌ No files generated!")
     else:
@@ -5,27 +5,181 @@ Provides API endpoints for generating signal HTML files
 """
 
 import os
+import sys
 import json
+import hashlib
+import atexit
+import logging
+import logging.handlers
+import queue
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Flask, request, jsonify, send_file, render_template_string
-from flask_cors import CORS
+from flask import Flask, request, jsonify, send_from_directory, render_template_string
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import NotFound
 from signal_renderer import (
     SignalRenderer, SignalData, SignalType, SignalPriority, 
-    ChartData, KeyStat, StrategyInfo, generate_chart_data
+    ChartData, KeyStat, StrategyInfo, generate_chart_data,
+    SIGNAL_TYPES_BY_NAME, PRIORITIES_BY_NAME
 )
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # fallback fast JSON codec when orjson is missing
+    ujson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # optional response compression
+    Compress = None
+
+try:
+    from gevent.pywsgi import WSGIServer
+except ImportError:  # optional production server for --prod
+    WSGIServer = None
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson"""
+    
+    def _options(self, pretty: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response - no str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(pretty) | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+class UjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with ujson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        # ujson has no separators option; its output is already compact
+        return ujson.dumps(
+            obj,
+            default=self.default,
+            ensure_ascii=kwargs.get('ensure_ascii', self.ensure_ascii),
+            sort_keys=kwargs.get('sort_keys', self.sort_keys),
+            indent=kwargs.get('indent') or 0,
+            escape_forward_slashes=False
+        )
+    
+    def loads(self, s, **kwargs):
+        return ujson.loads(s)
+
 app = Flask(__name__)
-CORS(app)  # Enable CORS for web GUI
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+    _JSON_CODEC = "orjson"
+elif ujson is not None:
+    app.json = UjsonProvider(app)
+    _JSON_CODEC = "ujson"
+else:
+    _JSON_CODEC = "json"
+
+# Open CORS for the web GUI: the same fixed headers on every response,
+# preflights included (Flask answers OPTIONS itself)
+_CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type'),
+    ('Access-Control-Max-Age', '86400'),
+)
+
+@app.after_request
+def _add_cors_headers(response):
+    response.headers.extend(_CORS_HEADERS)
+    return response
+
+# Compress JSON, the GUI page and /view signal pages when Flask-Compress is
+# installed (brotli first if the brotli package is available, else gzip).
+# File responses are direct passthrough, which Flask-Compress leaves alone,
+# so /view opts in below; /download attachments are sent as stored
+if Compress is not None:
+    app.config.update(
+        COMPRESS_MIMETYPES=['application/json', 'text/html'],
+        COMPRESS_LEVEL=6,
+        COMPRESS_BR_LEVEL=5,
+        COMPRESS_MIN_SIZE=500,
+        COMPRESS_ALGORITHM=['br', 'gzip'],
+    )
+    Compress(app)
+
+# Request-path logging; main() attaches a queue-backed console handler so
+# formatting and writes happen off the request threads
+logger = logging.getLogger("signalpro.web")
 
 # Initialize renderer
 renderer = SignalRenderer(output_dir="web_generated")
 
+
+# Absolute output directory with a trailing separator, resolved once; files
+# are served from it by plain concatenation
+_OUTPUT_PREFIX = os.path.join(os.path.abspath(renderer.output_dir), "")
+
+# Background renders for /api/generate?async=1 run on this process's pool,
+# but their status lives in one JSON file per job under the output directory,
+# so any worker process on the host can answer /api/jobs/<id>. Status files
+# older than JOB_TTL seconds are pruned as new jobs arrive
+JOB_TTL = 3600
+_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="render")
+_JOBS_DIR = os.path.join(_OUTPUT_PREFIX + ".jobs", "")
+os.makedirs(_JOBS_DIR, exist_ok=True)
+_JOB_ID = re.compile(r"[0-9a-f]{32}")
+
+# The enums are fixed after import, so /api/types always sends the same body
+_TYPES_BODY = (app.json.dumps({
+    'signal_types': [
+        {'value': st.name, 'label': st.name.replace('_', ' ').title()} 
+        for st in SignalType
+    ],
+    'priorities': [
+        {'value': sp.name, 'label': sp.value if sp.value else sp.name} 
+        for sp in SignalPriority
+    ]
+}) + "\n").encode('utf-8')
+_TYPES_ETAG = hashlib.sha1(_TYPES_BODY).hexdigest()
+
+# (st_mtime_ns, body, etag) of the last web_gui.html read by index()
+_index_page = None
+
 @app.route('/')
 def index():
     """Serve the web GUI"""
+    global _index_page
     try:
-        with open('web_gui.html', 'r', encoding='utf-8') as f:
-            return f.read()
+        # Re-read the page only when it changed on disk since the last hit
+        mtime = os.stat('web_gui.html').st_mtime_ns
+        if _index_page is None or _index_page[0] != mtime:
+            with open('web_gui.html', 'rb') as f:
+                body = f.read()
+            _index_page = (mtime, body, hashlib.sha1(body).hexdigest())
+            
+        _, body, etag = _index_page
+        response = app.response_class(body, mimetype='text/html')
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 60
+        return response.make_conditional(request)
     except FileNotFoundError:
         return """
         <h1>SignalPro Web GUI</h1>
@@ -41,25 +195,26 @@ def index():
 @app.route('/api/types', methods=['GET'])
 def get_types():
     """Get available signal types and priorities"""
-    return jsonify({
-        'signal_types': [
-            {'value': st.name, 'label': st.name.replace('_', ' ').title()} 
-            for st in SignalType
-        ],
-        'priorities': [
-            {'value': sp.name, 'label': sp.value if sp.value else sp.name} 
-            for sp in SignalPriority
-        ]
-    })
+    response = app.response_class(_TYPES_BODY, mimetype='application/json')
+    response.set_etag(_TYPES_ETAG)
+    return response.make_conditional(request)
 
 @app.route('/api/preview', methods=['POST'])
 def preview_signal():
     """Preview signal data without generating HTML"""
     try:
-        data = request.json
+        data = _parse_body()
         signal_data = create_signal_from_request(data)
         
-        # Return preview data
+        # Return preview data; the chart series are left out, so the
+        # dataclasses' own to_dict() is used rather than a deep asdict()
+        strategy = signal_data.strategy
+        if strategy:
+            description = strategy.description
+            if len(description) > 200:
+                description = description[:200] + '...'
+            strategy = {'title': strategy.title, 'description': description}
+        
         preview = {
             'ticker': signal_data.ticker,
             'company_name': signal_data.company_name,
@@ -67,18 +222,8 @@ def preview_signal():
             'priority': signal_data.priority.name,
             'current_price': signal_data.current_price,
             'price_change_percent': signal_data.price_change_percent,
-            'key_stats': [
-                {
-                    'value': stat.value,
-                    'label': stat.label,
-                    'is_positive': stat.is_positive
-                }
-                for stat in signal_data.key_stats
-            ],
-            'strategy': {
-                'title': signal_data.strategy.title,
-                'description': signal_data.strategy.description[:200] + '...' if len(signal_data.strategy.description) > 200 else signal_data.strategy.description
-            } if signal_data.strategy else None,
+            'key_stats': [stat.to_dict() for stat in signal_data.key_stats],
+            'strategy': strategy,
             'timestamp': signal_data.timestamp,
             'is_yolo': signal_data.is_yolo
         }
@@ -96,68 +241,134 @@ def preview_signal():
 
 @app.route('/api/generate', methods=['POST'])
 def generate_signal():
-    """Generate signal HTML file"""
+    """Generate signal HTML file (in the background with ?async=1)"""
     try:
-        data = request.json
-        print(f"📊 Received request: {data.get('ticker', 'Unknown')} - {data.get('signalType', 'Unknown')}")
+        data = _parse_body()
+        logger.info("📊 Received request: %s - %s", data.get('ticker', 'Unknown'), data.get('signalType', 'Unknown'))
         
         # Create signal data
         signal_data = create_signal_from_request(data)
         
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{signal_data.ticker}_{signal_data.signal_type.name.lower()}_{timestamp}.html"
-        
-        # Generate HTML
-        output_path = renderer.render_signal(signal_data, filename)
-        
-        # Verify file was created
-        if not os.path.exists(output_path):
-            raise Exception("HTML file was not generated")
+        # Plain int formatting of one datetime; same text as strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        filename = f"{signal_data.ticker}_{signal_data.signal_type.slug}_{timestamp}.html"
         
-        file_size = os.path.getsize(output_path)
-        abs_path = os.path.abspath(output_path)
+        if request.args.get('async') == '1':
+            # Hand the render to the pool and let the client poll /api/jobs/<id>
+            job_id = uuid.uuid4().hex
+            _prune_jobs()
+            _write_job(job_id, {'success': True, 'job_id': job_id, 'state': 'pending'})
+            _EXECUTOR.submit(_run_job, job_id, signal_data, filename)
+                
+            return jsonify({
+                'success': True,
+                'job_id': job_id,
+                'filename': filename,
+                'status_url': f"/api/jobs/{job_id}"
+            }), 202
         
-        print(f"✅ Generated: {filename} ({file_size:,} bytes)")
-        
-        return jsonify({
-            'success': True,
-            'filename': filename,
-            'file_path': output_path,
-            'file_size': file_size,
-            'absolute_path': abs_path,
-            'download_url': f"/download/{filename}",
-            'view_url': f"file://{abs_path}",
-            'signal_data': {
-                'ticker': signal_data.ticker,
-                'signal_type': signal_data.signal_type.name,
-                'price': signal_data.current_price,
-                'change_percent': signal_data.price_change_percent,
-                'priority': signal_data.priority.name
-            }
-        })
+        return jsonify(_render_and_describe(signal_data, filename))
         
     except Exception as e:
-        print(f"❌ Generation error: {e}")
+        logger.error("❌ Generation error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 400
 
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Report on a background generation started with /api/generate?async=1"""
+    try:
+        if not _JOB_ID.fullmatch(job_id):
+            raise FileNotFoundError(job_id)
+        with open(_JOBS_DIR + job_id + ".json", 'rb') as f:
+            status = app.json.loads(f.read())
+    except FileNotFoundError:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    code = {'pending': 202, 'failed': 400}.get(status['state'], 200)
+    return jsonify(status), code
+
+def _write_job(job_id, status):
+    """Atomically replace a job's status file"""
+    path = _JOBS_DIR + job_id + ".json"
+    with open(path + ".tmp", 'w', encoding='utf-8') as f:
+        f.write(app.json.dumps(status))
+    os.replace(path + ".tmp", path)
+
+def _run_job(job_id, signal_data, filename):
+    """Render a background job and record its outcome"""
+    try:
+        status = dict(_render_and_describe(signal_data, filename), job_id=job_id, state='done')
+    except Exception as e:
+        logger.error("❌ Generation error: %s", e)
+        status = {'success': False, 'job_id': job_id, 'state': 'failed', 'error': str(e)}
+    _write_job(job_id, status)
+
+def _prune_jobs():
+    """Remove status files of jobs older than JOB_TTL"""
+    cutoff = datetime.now().timestamp() - JOB_TTL
+    with os.scandir(_JOBS_DIR) as it:
+        for entry in it:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass  # already pruned by another worker
+
+def _render_and_describe(signal_data, filename):
+    """Render a signal and build the /api/generate response body for it"""
+    # Generate HTML
+    output_path = renderer.render_signal(signal_data, filename)
+    
+    # Verify file was created; one stat covers existence and size, and the
+    # absolute path comes from the resolved output directory
+    try:
+        file_size = os.stat(output_path).st_size
+    except FileNotFoundError:
+        raise Exception("HTML file was not generated")
+    abs_path = _OUTPUT_PREFIX + filename
+    
+    logger.info("✅ Generated: %s (%s bytes)", filename, f"{file_size:,}")
+    
+    return {
+        'success': True,
+        'filename': filename,
+        'file_path': output_path,
+        'file_size': file_size,
+        'absolute_path': abs_path,
+        'download_url': f"/download/{filename}",
+        'view_url': f"file://{abs_path}",
+        'signal_data': {
+            'ticker': signal_data.ticker,
+            'signal_type': signal_data.signal_type.name,
+            'price': signal_data.current_price,
+            'change_percent': signal_data.price_change_percent,
+            'priority': signal_data.priority.name
+        }
+    }
+
 @app.route('/download/<filename>')
 def download_file(filename):
     """Download generated HTML file"""
     try:
-        file_path = os.path.join(renderer.output_dir, filename)
-        if not os.path.exists(file_path):
-            return jsonify({'error': 'File not found'}), 404
-        
-        return send_file(
-            file_path,
+        # safe_join keeps the name inside the output directory; repeat
+        # downloads revalidate against the ETag and come back 304
+        return send_from_directory(
+            _OUTPUT_PREFIX,
+            filename,
             as_attachment=True,
             download_name=filename,
-            mimetype='text/html'
+            mimetype='text/html',
+            conditional=True,
+            etag=True,
+            max_age=3600
         )
+    except NotFound:
+        return jsonify({'error': 'File not found'}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -165,12 +376,16 @@ def download_file(filename):
 def view_file(filename):
     """View generated HTML file in browser"""
     try:
-        file_path = os.path.join(renderer.output_dir, filename)
-        if not os.path.exists(file_path):
-            return "File not found", 404
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        # Streamed from disk, with ETag/Last-Modified for cheap reloads;
+        # safe_join keeps the name inside the output directory, as in /download
+        response = send_from_directory(_OUTPUT_PREFIX, filename, mimetype='text/html', conditional=True, max_age=0)
+        if Compress is not None and response.status_code == 200:
+            # Let Flask-Compress read full pages so they can be sent
+            # compressed; 206 ranges and 304s are passed through untouched
+            response.direct_passthrough = False
+        return response
+    except NotFound:
+        return "File not found", 404
     except Exception as e:
         return f"Error loading file: {e}", 500
 
@@ -178,23 +393,28 @@ def view_file(filename):
 def list_files():
     """List generated files"""
     try:
-        files = []
-        if os.path.exists(renderer.output_dir):
-            for filename in os.listdir(renderer.output_dir):
-                if filename.endswith('.html'):
-                    file_path = os.path.join(renderer.output_dir, filename)
-                    file_size = os.path.getsize(file_path)
-                    file_time = os.path.getmtime(file_path)
-                    
-                    files.append({
-                        'filename': filename,
-                        'size': file_size,
-                        'created': datetime.fromtimestamp(file_time).isoformat(),
-                        'download_url': f"/download/{filename}",
-                        'view_url': f"/view/{filename}"
-                    })
+        # One stat per page, sorted on the raw mtime before any formatting
+        pages = []
+        try:
+            with os.scandir(_OUTPUT_PREFIX) as it:
+                for entry in it:
+                    if entry.name.endswith('.html'):
+                        pages.append((entry.name, entry.stat()))
+        except FileNotFoundError:
+            pass
         
-        files.sort(key=lambda x: x['created'], reverse=True)
+        pages.sort(key=lambda page: page[1].st_mtime, reverse=True)
+        
+        files = [
+            {
+                'filename': filename,
+                'size': st.st_size,
+                'created': datetime.fromtimestamp(st.st_mtime).isoformat(timespec='seconds'),
+                'download_url': f"/download/{filename}",
+                'view_url': f"/view/{filename}"
+            }
+            for filename, st in pages
+        ]
         
         return jsonify({
             'success': True,
@@ -208,59 +428,60 @@ def list_files():
             'error': str(e)
         }), 400
 
+def _parse_body():
+    """Decode the JSON request body from its raw bytes, without caching them"""
+    return app.json.loads(request.get_data(cache=False))
+
 def create_signal_from_request(data):
     """Convert request data to SignalData object"""
+    get = data.get
     
     # Parse key stats
-    key_stats = []
-    stats_data = data.get('stats', [])
-    for stat in stats_data:
-        if stat.get('value') and stat.get('label'):
-            key_stats.append(KeyStat(
-                value=stat['value'],
-                label=stat['label'],
-                is_positive=stat.get('is_positive', True)
-            ))
+    key_stats = [
+        KeyStat(stat['value'], stat['label'], stat.get('is_positive', True))
+        for stat in get('stats', [])
+        if stat.get('value') and stat.get('label')
+    ]
     
     # Create strategy info
     strategy = None
-    if data.get('strategyTitle') and data.get('strategyDesc'):
+    if get('strategyTitle') and get('strategyDesc'):
         strategy = StrategyInfo(
             title=data['strategyTitle'],
             description=data['strategyDesc'],
-            link_text=data.get('strategyLinkText', 'Learn more →'),
-            link_url=data.get('strategyLinkUrl', 'https://example.com/strategy')
+            link_text=get('strategyLinkText', 'Learn more →'),
+            link_url=get('strategyLinkUrl', 'https://example.com/strategy')
         )
     
     # Generate chart data
-    current_price = float(data.get('currentPrice', 100.0))
-    chart_pattern = data.get('chartPattern', 'momentum')
-    chart_data = generate_chart_data(data.get('ticker', 'STOCK'), current_price, chart_pattern)
+    ticker = get('ticker', 'STOCK')
+    current_price = float(get('currentPrice', 100.0))
+    chart_data = generate_chart_data(ticker, current_price, get('chartPattern', 'momentum'))
     
     # Set event label
-    event_label = data.get('eventLabel', '')
+    event_label = get('eventLabel', '')
     if event_label:
         chart_data.event_label = event_label
     
     # Calculate price change
-    change_percent = float(data.get('changePercent', 0))
+    change_percent = float(get('changePercent', 0))
     price_change = current_price * (change_percent / 100)
     
     # Create signal data
     signal_data = SignalData(
-        ticker=data.get('ticker', 'STOCK').upper(),
-        company_name=data.get('companyName', 'Unknown Company'),
-        signal_type=SignalType[data.get('signalType', 'EARNINGS')],
+        ticker=ticker.upper(),
+        company_name=get('companyName', 'Unknown Company'),
+        signal_type=SIGNAL_TYPES_BY_NAME[get('signalType', 'EARNINGS')],
         current_price=current_price,
         price_change=price_change,
         price_change_percent=change_percent,
-        priority=SignalPriority[data.get('priority', 'NORMAL')],
+        priority=PRIORITIES_BY_NAME[get('priority', 'NORMAL')],
         key_stats=key_stats,
         strategy=strategy,
         chart_data=chart_data,
-        timestamp=data.get('timestamp', 'Just now'),
-        is_yolo=data.get('isYolo', False),
-        border_style=data.get('borderStyle', 'solid')
+        timestamp=get('timestamp', 'Just now'),
+        is_yolo=get('isYolo', False),
+        border_style=get('borderStyle', 'solid')
     )
     
     return signal_data
@@ -273,24 +494,49 @@ def not_found(error):
 def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
+def _start_logging(level):
+    """Route request logging through a queue to a console handler thread"""
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+
 def main():
     """Run the web server"""
     print("🌐 SignalPro Web Server")
     print("=" * 40)
     print("📱 Web GUI: http://localhost:5000")
+    print(f"🧩 JSON codec: {_JSON_CODEC}")
     print("🔗 API Endpoints:")
     print("   • GET  /api/types - Signal types and priorities")
     print("   • POST /api/preview - Preview signal data")
-    print("   • POST /api/generate - Generate signal HTML")
+    print("   • POST /api/generate - Generate signal HTML (?async=1 for a job)")
+    print("   • GET  /api/jobs/<id> - Background generation status")
     print("   • GET  /api/files - List generated files")
     print("   • GET  /download/<file> - Download HTML file")
     print("   • GET  /view/<file> - View HTML file")
     print("=" * 40)
-    print("🚀 Starting server...")
     
-    # Create output directory
-    os.makedirs(renderer.output_dir, exist_ok=True)
+    # --prod serves through gevent's WSGI server instead of the debug server,
+    # and only logs warnings and errors
+    prod = "--prod" in sys.argv[1:]
+    _start_logging(logging.WARNING if prod else logging.INFO)
+    
+    if prod:
+        if WSGIServer is None:
+            print("❌ --prod needs gevent: pip install gevent")
+            sys.exit(1)
+        print("🚀 Starting production server (gevent)...")
+        WSGIServer(('0.0.0.0', 5000), app).serve_forever()
+        return
     
+    print("🚀 Starting server...")
     app.run(
         host='0.0.0.0',
         port=5000,